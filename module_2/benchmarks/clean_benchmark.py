@@ -0,0 +1,82 @@
+"""
+Module: clean_benchmark.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Throughput of row-wise clean_data against column-wise clean_data_batch.
+
+Usage (from module_2):
+    python -m benchmarks.clean_benchmark [--count N]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+from benchmarks.tags_benchmark import TAG_POOL
+from clean import clean_data, clean_data_batch
+
+UNIVERSITIES = ["Johns Hopkins University", "MIT", "Stanford University", "University of Toronto"]
+PROGRAMS = ["Computer Science", "Physics", "Economics", "Mechanical Engineering"]
+STATUSES = ["Accepted on 3 Mar", "Rejected on 14 Feb", "Wait listed on 1 Apr", "Interview", ""]
+COMMENTS = [
+    "",
+    "Got the email this morning!",
+    "Funded offer.\nStill waiting on two more.",
+    "<p>Interview was   <b>great</b></p>",
+    "Can\\u2019t wait \\ud83d\\ude2c",
+    "Très content",
+]
+
+
+def synthetic_raw_entries(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Builds raw entries shaped like the scraper output.
+
+    Args:
+        count: Number of entries.
+        seed: Random seed, for repeatable runs.
+
+    Returns:
+        The raw entries.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "university": rng.choice(UNIVERSITIES),
+            "program_name": rng.choice(PROGRAMS),
+            "degree": rng.choice(["Masters", "PhD"]),
+            "date_added": "March 3, 2025",
+            "status": rng.choice(STATUSES),
+            "url": f"/result/{n}",
+            "tags": rng.sample(TAG_POOL, rng.randint(0, 6)),
+            "comments": rng.choice(COMMENTS) + (f" ({n})" if rng.random() < 0.4 else ""),
+        }
+        for n in range(count)
+    ]
+
+
+def _throughput(clean: Callable[[list[dict[str, Any]]], object], raw: list[dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    clean(raw)
+    return len(raw) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare row-wise and column-wise cleaning.")
+    parser.add_argument("--count", type=int, default=200_000, help="number of raw entries")
+    args = parser.parse_args()
+
+    raw = synthetic_raw_entries(args.count)
+    if clean_data_batch(raw[:10_000]) != clean_data(raw[:10_000]):
+        raise AssertionError("clean_data_batch output differs from clean_data")
+
+    print(f"{args.count:,} raw entries")
+    rows = _throughput(clean_data, raw)
+    columns = _throughput(clean_data_batch, raw)
+    print(f"{'clean_data':<18}{rows:>12,.0f} entries/s")
+    print(f"{'clean_data_batch':<18}{columns:>12,.0f} entries/s  ({columns / rows:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
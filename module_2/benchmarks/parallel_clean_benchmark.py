@@ -0,0 +1,54 @@
+"""
+Module: parallel_clean_benchmark.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Wall-clock time of serial clean_data against clean_data_parallel at several sizes.
+
+Usage (from module_2):
+    python -m benchmarks.parallel_clean_benchmark [--sizes 10000 100000 1000000]
+                                                   [--workers N] [--chunk-size K]
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from benchmarks.clean_benchmark import synthetic_raw_entries
+from clean import clean_data, clean_data_parallel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare serial and multi-process cleaning.")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+        help="numbers of raw entries to clean"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="entries per chunk")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"{args.workers} workers, chunks of {args.chunk_size:,} ({os.cpu_count()} CPUs)")
+    print(f"{'entries':>10}{'serial':>12}{'parallel':>12}{'speedup':>10}")
+    for size in args.sizes:
+        raw = synthetic_raw_entries(size)
+
+        start = time.perf_counter()
+        serial = clean_data(raw)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = clean_data_parallel(raw, workers=args.workers, chunk_size=args.chunk_size)
+        parallel_time = time.perf_counter() - start
+
+        if parallel != serial:
+            raise AssertionError(f"clean_data_parallel output differs at {size} entries")
+        print(f"{size:>10,}{serial_time:>11.2f}s{parallel_time:>11.2f}s"
+              f"{serial_time / parallel_time:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
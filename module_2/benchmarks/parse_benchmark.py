@@ -0,0 +1,65 @@
+"""
+Module: parse_benchmark.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Compares per-page parse time of the installed HTML parser backends.
+
+Usage (from module_2):
+    python -m benchmarks.parse_benchmark [--repeat N] [FIXTURE.html ...]
+
+Defaults to the saved GradCafe-style pages in tests/fixtures.
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+from parsers import PARSER_BACKENDS, available_backends
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def benchmark_backends(pages: list[str], repeat: int) -> dict[str, float]:
+    """Times every installed backend over the given pages.
+
+    Args:
+        pages: HTML of the pages to parse.
+        repeat: Number of timed passes over all pages; the fastest pass is kept.
+
+    Returns:
+        Mapping of backend name to best per-page parse time in milliseconds.
+    """
+    reference = [PARSER_BACKENDS["bs4"](html) for html in pages]
+    timings: dict[str, float] = {}
+    for backend in available_backends():
+        parse = PARSER_BACKENDS[backend]
+        if [parse(html) for html in pages] != reference:
+            raise AssertionError(f"Backend '{backend}' output differs from bs4")
+        passes = timeit.repeat(
+            lambda parse=parse: [parse(html) for html in pages], number=1, repeat=repeat
+        )
+        timings[backend] = min(passes) / len(pages) * 1000
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare HTML parser backend speed.")
+    parser.add_argument("fixtures", nargs="*", type=Path, help="HTML pages to parse")
+    parser.add_argument("--repeat", type=int, default=20, help="timed passes per backend")
+    args = parser.parse_args()
+
+    paths = args.fixtures or sorted(FIXTURES_DIR.glob("*.html"))
+    pages = [path.read_text(encoding="utf-8") for path in paths]
+    entries = sum(len(PARSER_BACKENDS["bs4"](html)) for html in pages)
+    print(f"{len(pages)} page(s), {entries} entries, best of {args.repeat} passes")
+
+    timings = benchmark_backends(pages, args.repeat)
+    baseline = timings["bs4"]
+    print(f"{'backend':<12}{'ms/page':>10}{'speedup':>10}")
+    for backend, ms in sorted(timings.items(), key=lambda item: item[1]):
+        print(f"{backend:<12}{ms:>10.3f}{baseline / ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
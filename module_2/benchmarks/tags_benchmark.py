@@ -0,0 +1,102 @@
+"""
+Module: tags_benchmark.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Throughput of the table-driven tag classifier against the original regex chain.
+
+Usage (from module_2):
+    python -m benchmarks.tags_benchmark [--count N]
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, Optional
+
+from clean import _parse_tags
+
+TAG_POOL = [
+    "Fall 2025", "Spring 2026", "Fall 2024", "Summer 2025", "American", "International",
+    "Other", "US Citizen", "Int'l", "GPA 3.85", "GPA: 3.4", "GPA 3.92", "GRE 320", "GRE 331",
+    "GRE V 160", "GRE V: 155", "GRE Q 168", "GRE AW 4.5", "GRE AW 5", "Masters", "Funding",
+]
+
+
+def legacy_parse_tags(tags: list[str]) -> dict[str, Optional[str]]:
+    """The original _parse_tags: up to seven regex calls through the module-level cache."""
+    info: dict[str, Optional[str]] = {
+        "term": "",
+        "us_international": "",
+        "gre_score": "",
+        "gre_v_score": "",
+        "gre_q_score": "",
+        "gre_aw_score": "",
+        "gpa": "",
+    }
+
+    for tag in tags:
+        t = tag.lower()
+
+        if re.fullmatch(r"(fall|spring|summer|winter) \d{4}", t):
+            info["term"] = tag
+        elif t in {"american", "us", "domestic", "us citizen"}:
+            info["us_international"] = "American"
+        elif t in {"international", "non-us", "intl", "int'l"}:
+            info["us_international"] = "International"
+        elif m := re.match(r"gre\s*(\d{2,3})", t):
+            info["gre_score"] = m.group(1)
+        elif m := re.match(r"gre v[: ]\s*(\d{2,3})", t):
+            info["gre_v_score"] = m.group(1)
+        elif m := re.match(r"gre q[: ]\s*(\d{2,3})", t):
+            info["gre_q_score"] = m.group(1)
+        elif m := re.match(r"gre aw[: ]\s*(\d(\.\d)?)", t):
+            info["gre_aw_score"] = m.group(1)
+        elif m := re.match(r"gpa[: =]?\s*(\d\.\d{1,2})", t):
+            info["gpa"] = m.group(1)
+
+    return info
+
+
+def synthetic_tag_lists(count: int, seed: int = 0) -> list[list[str]]:
+    """Builds GradCafe-like tag lists of 0 to 6 tags each.
+
+    Args:
+        count: Number of tag lists.
+        seed: Random seed, for repeatable runs.
+
+    Returns:
+        The tag lists.
+    """
+    rng = random.Random(seed)
+    return [rng.sample(TAG_POOL, rng.randint(0, 6)) for _ in range(count)]
+
+
+def _throughput(parse: Callable[[list[str]], object], tag_lists: list[list[str]]) -> float:
+    start = time.perf_counter()
+    for tags in tag_lists:
+        parse(tags)
+    return len(tag_lists) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare tag classifier throughput.")
+    parser.add_argument("--count", type=int, default=1_000_000, help="number of tag lists")
+    args = parser.parse_args()
+
+    tag_lists = synthetic_tag_lists(args.count)
+    for tags in tag_lists[:10_000]:
+        if _parse_tags(tags) != legacy_parse_tags(tags):
+            raise AssertionError(f"Classifier output differs for {tags}")
+
+    tags_total = sum(len(tags) for tags in tag_lists)
+    print(f"{args.count:,} tag lists, {tags_total:,} tags")
+    legacy = _throughput(legacy_parse_tags, tag_lists)
+    table = _throughput(_parse_tags, tag_lists)
+    print(f"{'regex chain':<16}{legacy:>14,.0f} lists/s")
+    print(f"{'table-driven':<16}{table:>14,.0f} lists/s  ({table / legacy:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Module: client.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Reusable HTTP client for The GradCafe scraper.
+
+A single ScraperClient owns one keep-alive urllib3 connection pool, so every page and the
+robots.txt check reuse the same TCP/TLS connections instead of paying a new handshake per request.
+Timeouts and retry/backoff are configured once on the pool.
+"""
+
+import logging
+import threading
+from types import TracebackType
+from typing import Optional
+
+import urllib3
+
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (GradCafeScraper/1.0)"}
+
+# Transient statuses worth retrying; 429 honours the server's Retry-After header
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class ScraperClient:
+    """Keep-alive HTTP client shared by the scraper and the robots.txt check."""
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Initialize the client and its connection pool.
+
+        Args:
+            pool_size: Maximum keep-alive connections per host. Should be at least the number of
+                concurrent fetch workers; extra callers wait for a free connection.
+            connect_timeout: Seconds to wait for a connection to be established.
+            read_timeout: Seconds to wait for the server to send data.
+            retries: Maximum retries for connection errors and transient HTTP statuses.
+            backoff_factor: Exponential backoff factor between retries.
+            headers: Headers sent with every request. Defaults to HTTP_HEADERS.
+        """
+        self.headers = dict(headers or HTTP_HEADERS)
+        self._http = urllib3.PoolManager(
+            maxsize=pool_size,
+            block=True,
+            timeout=urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+            retries=urllib3.Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            ),
+        )
+
+    def request(self, url: str) -> urllib3.BaseHTTPResponse:
+        """Send a GET request through the shared pool.
+
+        Args:
+            url: URL to fetch.
+
+        Returns:
+            The HTTP response, whatever its status.
+        """
+        return self._http.request("GET", url, headers=self.headers)
+
+    def fetch(self, url: str) -> Optional[str]:
+        """Fetch the HTML content of a page.
+
+        Args:
+            url: URL to fetch.
+
+        Returns:
+            HTML content as string or None if failed.
+        """
+        logging.info(f"Fetching URL: {url}")
+        try:
+            response = self.request(url)
+            if response.status != 200:
+                logging.error(f"Failed to fetch {url} with status {response.status}")
+                return None
+            return response.data.decode("utf-8")
+        except Exception as e:
+            logging.error(f"Exception fetching {url}: {e}")
+            return None
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._http.clear()
+
+    def __enter__(self) -> "ScraperClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class _ClientHolder:
+    """Holds the process-wide client, created by get_default_client."""
+
+    client: Optional[ScraperClient] = None
+    lock = threading.Lock()
+
+
+_holder = _ClientHolder()
+
+
+def get_default_client() -> ScraperClient:
+    """Return the process-wide client, creating it on first use.
+
+    Returns:
+        The shared ScraperClient.
+    """
+    with _holder.lock:
+        if _holder.client is None:
+            _holder.client = ScraperClient()
+        return _holder.client
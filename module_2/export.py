@@ -0,0 +1,235 @@
+"""
+Module: export.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Exports cleaned GradCafe data to typed, columnar Parquet or Arrow IPC files.
+
+The cleaned JSON keeps every field as text. The export stores GRE scores and GPA as floats and
+the added/decision dates as real dates, so analytics tools can scan, filter and aggregate the
+columns directly. The format follows the file extension:
+- ".parquet": compressed Parquet, the smallest on disk.
+- ".arrow", ".feather" or ".ipc": uncompressed Arrow IPC, which read_columns memory-maps without
+  copying.
+
+Requires the optional pyarrow package (pip install pyarrow).
+
+Usage:
+    python3 export.py applicant_data.json applicant_data.parquet
+"""
+
+import argparse
+import logging
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+    ipc = None
+
+from clean import iter_data
+
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+PARQUET_EXTENSIONS = (".parquet",)
+
+TEXT_COLUMNS = ("url", "university", "program_name", "term", "status", "comments",
+                "us_international", "degree")
+FLOAT_COLUMNS = ("gre_score", "gre_v_score", "gre_q_score", "gre_aw_score", "gpa")
+DATE_COLUMNS = ("date_added", "decision_date")
+
+# Column order of the exported files, the same as the cleaned JSON records
+EXPORT_COLUMNS = ("url", "university", "program_name", "date_added", "term", "status",
+                  "decision_date", "comments", "us_international", "gre_score", "gre_v_score",
+                  "gre_q_score", "gre_aw_score", "degree", "gpa")
+
+# date_added looks like "April 15, 2025"; decision dates like "14 Apr" carry no year
+_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d")
+_DAY_MONTH_FORMATS = ("%d %b %Y", "%d %B %Y")
+
+
+def applicant_schema() -> "pa.Schema":
+    """Returns the Arrow schema of exported applicant data.
+
+    Returns:
+        Schema with text columns as strings, scores and GPA as float64 and dates as date32.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+    """
+    _require_pyarrow()
+    types = {
+        **dict.fromkeys(TEXT_COLUMNS, pa.string()),
+        **dict.fromkeys(FLOAT_COLUMNS, pa.float64()),
+        **dict.fromkeys(DATE_COLUMNS, pa.date32()),
+    }
+    return pa.schema([(name, types[name]) for name in EXPORT_COLUMNS])
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("Parquet/Arrow export requires the pyarrow package.")
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Converts a cleaned score or GPA ("3.85", "" or None) to a float, None if it is not one."""
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _to_date(value: Optional[str]) -> Optional[date]:
+    """Converts a cleaned date_added ("April 15, 2025") to a date, None if it is not one."""
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()  # type: ignore
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _to_decision_date(value: Optional[str], added: Optional[date]) -> Optional[date]:
+    """Converts a decision date ("14 Apr") to a date, taking the year from the date added.
+
+    A decision falling after the day the entry was added must be from the previous year.
+    Full dates are converted as they are.
+    """
+    full_date = _to_date(value)
+    if full_date is not None or not value or added is None:
+        return full_date
+
+    for date_format in _DAY_MONTH_FORMATS:
+        try:
+            decided = datetime.strptime(f"{value} {added.year}", date_format).date()
+        except ValueError:
+            continue
+        if decided > added:
+            try:
+                decided = decided.replace(year=added.year - 1)
+            except ValueError:  # 29 Feb in a non-leap year
+                return None
+        return decided
+    return None
+
+
+def _to_batch(records: list[dict[str, Any]], schema: "pa.Schema") -> "pa.RecordBatch":
+    """Converts cleaned records into one typed Arrow record batch."""
+    columns: dict[str, list[Any]] = {
+        name: [record.get(name) or None for record in records]
+        for name in TEXT_COLUMNS
+    }
+    for name in FLOAT_COLUMNS:
+        columns[name] = [_to_float(record.get(name)) for record in records]
+    columns["date_added"] = [_to_date(record.get("date_added")) for record in records]
+    columns["decision_date"] = [
+        _to_decision_date(record.get("decision_date"), added)
+        for record, added in zip(records, columns["date_added"])
+    ]
+    return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def export_data(
+    records: Iterable[dict[str, Any]],
+    filename: str = "applicant_data.parquet",
+    batch_size: int = 50_000,
+) -> Optional[int]:
+    """Writes cleaned records to a typed Parquet or Arrow IPC file.
+
+    Records are converted and written ``batch_size`` at a time, so an iterator such as
+    clean.iter_data can be exported without holding every record in memory. Text fields that
+    are empty become nulls, as do scores and dates that cannot be converted.
+
+    Args:
+        records: Cleaned records.
+        filename: Output filename; its extension selects Parquet or Arrow IPC.
+        batch_size: Records per record batch (and per Parquet row group).
+
+    Returns:
+        Number of records exported, or None on failure.
+    """
+    try:
+        _require_pyarrow()
+        schema = applicant_schema()
+        lowered = filename.lower()
+        if lowered.endswith(PARQUET_EXTENSIONS):
+            writer = pq.ParquetWriter(filename, schema, compression="zstd")
+        elif lowered.endswith(ARROW_EXTENSIONS):
+            writer = ipc.new_file(filename, schema)
+        else:
+            raise ValueError(f"Unknown export format for {filename}; use .parquet or .arrow")
+
+        count = 0
+        with writer:
+            batch: list[dict[str, Any]] = []
+            for record in records:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    writer.write_batch(_to_batch(batch, schema))
+                    count += len(batch)
+                    batch = []
+            if batch or not count:
+                writer.write_batch(_to_batch(batch, schema))
+                count += len(batch)
+
+        logging.info(f"Exported {count} entries to {filename}")
+        return count
+    except OSError as e:
+        logging.error(f"File system error when exporting to {filename}: {e}", exc_info=True)
+    except Exception as e:
+        logging.error(f"Unexpected error while exporting to {filename}: {e}", exc_info=True)
+    return None
+
+
+def read_columns(filename: str, columns: Optional[list[str]] = None) -> "pa.Table":
+    """Reads selected columns of an exported file through a memory map.
+
+    Only the requested columns are read. Arrow IPC files are uncompressed, so their columns are
+    used straight from the memory-mapped file without being copied.
+
+    Args:
+        filename: Parquet or Arrow IPC file written by export_data.
+        columns: Column names to load (None loads them all).
+
+    Returns:
+        Arrow table with the requested columns.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+        ValueError: If the file extension is not a known export format.
+    """
+    _require_pyarrow()
+    lowered = filename.lower()
+    if lowered.endswith(PARQUET_EXTENSIONS):
+        return pq.read_table(filename, columns=columns, memory_map=True)
+    if lowered.endswith(ARROW_EXTENSIONS):
+        with pa.memory_map(filename, "r") as source:
+            table = ipc.open_file(source).read_all()
+        return table if columns is None else table.select(columns)
+    raise ValueError(f"Unknown export format for {filename}; use .parquet or .arrow")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Exports a cleaned JSON or JSON Lines file to Parquet or Arrow IPC.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Export cleaned GradCafe data to columns.")
+    parser.add_argument("source", help="cleaned .json, .jsonl or .ndjson file")
+    parser.add_argument("destination", help="output .parquet or .arrow file")
+    args = parser.parse_args(argv)
+
+    if export_data(iter_data(args.source), args.destination) is None:
+        logging.error("⚠️ Export failed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""
+Module: parsers.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Interchangeable HTML parser backends for GradCafe survey pages.
+
+Backends:
+- "bs4": BeautifulSoup with the pure-Python "html.parser" (always available, the reference and
+  the default).
+- "lxml": lxml's libxml2 HTML parser with XPath, when lxml is installed.
+- "selectolax": selectolax's Lexbor engine with CSS selectors, when selectolax is installed.
+
+On survey pages whose rows and cells are properly closed, every backend returns the same list of
+raw entry dictionaries, whatever else is sloppy about the markup. The faster backends build their
+trees the way browsers do, unlike "html.parser", so they can disagree with the reference on
+broken table structure: selectolax reads rows of a results table that has no explicit <tbody>,
+and both fill in missing </td> and </tr> tags where "html.parser" nests the following cells and
+rows. They are therefore only used when requested explicitly.
+
+Text is extracted the way BeautifulSoup's get_text(strip=True) does it: every text node is
+stripped and the pieces are joined without a separator. HTML comments, <script> and <style>
+contents are ignored.
+"""
+
+import logging
+from typing import Any, Callable, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+    lxml_html = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+ROW_SELECTOR = "table.tw-min-w-full tbody tr"
+DETAIL_ROW_CLASS = "tw-border-none"
+TAG_SELECTOR = "div.tw-inline-flex"
+
+# Backend used when none is requested explicitly; the only one matching itself on any markup
+DEFAULT_BACKEND = "bs4"
+# Backends from fastest to slowest
+BACKEND_PREFERENCE = ("selectolax", "lxml", "bs4")
+
+_LXML_ROWS_XPATH = (
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' tw-min-w-full ')]//tbody//tr"
+)
+_LXML_TAGS_XPATH = ".//div[contains(concat(' ', normalize-space(@class), ' '), ' tw-inline-flex ')]"
+
+
+def _entry(
+    university: str,
+    program_name: str,
+    degree: str,
+    date_added: str,
+    status: str,
+    url: str,
+    tags: list[str],
+    comments: str,
+) -> dict[str, Any]:
+    """Build a raw entry dictionary with the field order shared by all backends."""
+    return {
+        "university": university,
+        "program_name": program_name,
+        "degree": degree,
+        "date_added": date_added,
+        "status": status,
+        "url": url,
+        "tags": tags,
+        "comments": comments,
+    }
+
+
+def parse_with_bs4(html: str) -> list[dict[str, Any]]:
+    """Parse raw HTML with BeautifulSoup's pure-Python "html.parser".
+
+    Args:
+        html: HTML content.
+
+    Returns:
+        List of raw data dictionaries.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    rows = soup.select(ROW_SELECTOR)
+    results: list[dict[str, Any]] = []
+    i = 0
+
+    while i < len(rows):
+        row = rows[i]
+        if DETAIL_ROW_CLASS in row.get("class", []):
+            i += 1
+            continue
+
+        tds = row.find_all("td")
+        if len(tds) < 5:
+            i += 1
+            continue
+
+        university = tds[0].get_text(strip=True)
+        spans = tds[1].find_all("span")
+        program_name = spans[0].get_text(strip=True) if spans else ""
+        degree = spans[1].get_text(strip=True) if len(spans) > 1 else ""
+        date_added = tds[2].get_text(strip=True)
+        status = tds[3].get_text(strip=True)
+        a_tag = row.find("a")
+        url = a_tag["href"] if a_tag and "href" in a_tag.attrs else ""  # type: ignore
+
+        # Collect tags and comments from subsequent rows
+        tag_texts: list[str] = []
+        comments = ""
+        j = i + 1
+        while j < len(rows) and DETAIL_ROW_CLASS in rows[j].get("class", []):
+            tag_divs = rows[j].select(TAG_SELECTOR)
+            if tag_divs:
+                tag_texts.extend([d.get_text(strip=True) for d in tag_divs])
+            else:
+                comments = rows[j].get_text(strip=True)
+            j += 1
+
+        results.append(
+            _entry(university, program_name, degree, date_added, status, url, tag_texts, comments)
+        )
+        i = j
+
+    return results
+
+
+def _lxml_text(element: Any) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True) for an lxml element."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _lxml_is_detail_row(row: Any) -> bool:
+    return DETAIL_ROW_CLASS in (row.get("class") or "").split()
+
+
+def parse_with_lxml(html: str) -> list[dict[str, Any]]:
+    """Parse raw HTML with lxml.
+
+    Args:
+        html: HTML content.
+
+    Returns:
+        List of raw data dictionaries.
+
+    Raises:
+        RuntimeError: If lxml is not installed.
+    """
+    if lxml_html is None:
+        raise RuntimeError("The 'lxml' parser backend requires the lxml package.")
+    if not html.strip():
+        return []
+
+    document = lxml_html.document_fromstring(html)
+    etree.strip_elements(document, "script", "style", with_tail=False)
+    rows = document.xpath(_LXML_ROWS_XPATH)
+    results: list[dict[str, Any]] = []
+    i = 0
+
+    while i < len(rows):
+        row = rows[i]
+        if _lxml_is_detail_row(row):
+            i += 1
+            continue
+
+        tds = row.xpath(".//td")
+        if len(tds) < 5:
+            i += 1
+            continue
+
+        spans = tds[1].xpath(".//span")
+        a_tag = next(row.iter("a"), None)
+        url = a_tag.get("href") if a_tag is not None else None
+
+        tag_texts: list[str] = []
+        comments = ""
+        j = i + 1
+        while j < len(rows) and _lxml_is_detail_row(rows[j]):
+            tag_divs = rows[j].xpath(_LXML_TAGS_XPATH)
+            if tag_divs:
+                tag_texts.extend([_lxml_text(d) for d in tag_divs])
+            else:
+                comments = _lxml_text(rows[j])
+            j += 1
+
+        results.append(
+            _entry(
+                _lxml_text(tds[0]),
+                _lxml_text(spans[0]) if spans else "",
+                _lxml_text(spans[1]) if len(spans) > 1 else "",
+                _lxml_text(tds[2]),
+                _lxml_text(tds[3]),
+                url or "",
+                tag_texts,
+                comments,
+            )
+        )
+        i = j
+
+    return results
+
+
+def _lexbor_text(node: Any) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True) for a selectolax node."""
+    return node.text(deep=True, separator="", strip=True)
+
+
+def _lexbor_is_detail_row(row: Any) -> bool:
+    return DETAIL_ROW_CLASS in (row.attributes.get("class") or "").split()
+
+
+def parse_with_selectolax(html: str) -> list[dict[str, Any]]:
+    """Parse raw HTML with selectolax's Lexbor engine.
+
+    Args:
+        html: HTML content.
+
+    Returns:
+        List of raw data dictionaries.
+
+    Raises:
+        RuntimeError: If selectolax is not installed.
+    """
+    if LexborHTMLParser is None:
+        raise RuntimeError("The 'selectolax' parser backend requires the selectolax package.")
+
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style"])
+    rows = tree.css(ROW_SELECTOR)
+    results: list[dict[str, Any]] = []
+    i = 0
+
+    while i < len(rows):
+        row = rows[i]
+        if _lexbor_is_detail_row(row):
+            i += 1
+            continue
+
+        tds = row.css("td")
+        if len(tds) < 5:
+            i += 1
+            continue
+
+        spans = tds[1].css("span")
+        a_tag = row.css_first("a")
+        url = a_tag.attributes.get("href") if a_tag is not None else None
+
+        tag_texts: list[str] = []
+        comments = ""
+        j = i + 1
+        while j < len(rows) and _lexbor_is_detail_row(rows[j]):
+            tag_divs = rows[j].css(TAG_SELECTOR)
+            if tag_divs:
+                tag_texts.extend([_lexbor_text(d) for d in tag_divs])
+            else:
+                comments = _lexbor_text(rows[j])
+            j += 1
+
+        results.append(
+            _entry(
+                _lexbor_text(tds[0]),
+                _lexbor_text(spans[0]) if spans else "",
+                _lexbor_text(spans[1]) if len(spans) > 1 else "",
+                _lexbor_text(tds[2]),
+                _lexbor_text(tds[3]),
+                url or "",
+                tag_texts,
+                comments,
+            )
+        )
+        i = j
+
+    return results
+
+
+PARSER_BACKENDS: dict[str, Callable[[str], list[dict[str, Any]]]] = {
+    "bs4": parse_with_bs4,
+    "lxml": parse_with_lxml,
+    "selectolax": parse_with_selectolax,
+}
+
+
+def available_backends() -> list[str]:
+    """List the parser backends whose dependencies are installed, fastest first.
+
+    Returns:
+        Backend names from fastest to slowest.
+    """
+    installed = {
+        "bs4": True,
+        "lxml": lxml_html is not None,
+        "selectolax": LexborHTMLParser is not None,
+    }
+    return [name for name in BACKEND_PREFERENCE if installed[name]]
+
+
+def get_parser(backend: Optional[str] = None) -> Callable[[str], list[dict[str, Any]]]:
+    """Return the parse function for a backend.
+
+    Args:
+        backend: Backend name ("bs4", "lxml" or "selectolax"). None picks DEFAULT_BACKEND.
+
+    Returns:
+        Function taking page HTML and returning raw entry dictionaries.
+
+    Raises:
+        ValueError: If the backend is unknown or its dependency is not installed.
+    """
+    if backend is None:
+        backend = DEFAULT_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if backend not in available_backends():
+        raise ValueError(f"Parser backend '{backend}' is not installed.")
+    logging.debug(f"Using '{backend}' HTML parser backend")
+    return PARSER_BACKENDS[backend]
@@ -2,7 +2,7 @@
 Module: scrape.py
 Author: Billy Presume
 Created: 2025-06-01
-Modified: 2025-06-03
+Modified: 2026-10-18
 Description: Handles web scraping from The GradCafe website.
 
 This scraper was designed to respect TheGradCafe's robots.txt file.
@@ -14,12 +14,15 @@ Only public data is accessed, and requests are made responsibly using a custom U
 """
 
 import logging
-from typing import Any, Optional
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Container, Iterator, Optional
 
-import urllib3
-from bs4 import BeautifulSoup
-
-HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (GradCafeScraper/1.0)"}
+from client import ScraperClient, get_default_client
+from parsers import get_parser
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,112 +30,279 @@ logging.basicConfig(
 )
 
 
-def _fetch_page(url: str) -> Optional[str]:
+class _RateLimiter:
+    """Thread-safe limiter that spaces calls to at most ``rate`` per second across all workers."""
+
+    def __init__(self, rate: Optional[float] = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Maximum calls per second. None or a non-positive value disables limiting.
+        """
+        self._interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _fetch_page(url: str, client: Optional[ScraperClient] = None) -> Optional[str]:
     """Fetch the HTML content of a page.
 
     Args:
         url: URL to fetch.
+        client: Client to fetch with. Defaults to the shared process-wide client.
 
     Returns:
         HTML content as string or None if failed.
     """
-    http = urllib3.PoolManager()
-    logging.info(f"Fetching URL: {url}")
-    try:
-        response = http.request("GET", url, headers=HTTP_HEADERS)
-        if response.status != 200:
-            logging.error(f"Failed to fetch {url} with status {response.status}")
-            return None
-        return response.data.decode("utf-8")
-    except Exception as e:
-        logging.error(f"Exception fetching {url}: {e}")
-        return None
-
-
-def _parse_html(html: str) -> list[dict[str, Any]]:
+    return (client or get_default_client()).fetch(url)
+
+
+def _parse_html(html: str, backend: Optional[str] = None) -> list[dict[str, Any]]:
     """Parse raw HTML and extract raw entries.
 
     Args:
         html: HTML content.
+        backend: Parser backend ("bs4", "lxml" or "selectolax"). None uses "bs4", the reference
+            the faster backends are checked against.
 
     Returns:
         List of raw data dictionaries.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    rows = soup.select("table.tw-min-w-full tbody tr")
-    results: list[dict[str, Any]] = []
-    i = 0
-
-    while i < len(rows):
-        row = rows[i]
-        if "tw-border-none" in row.get("class", []):
-            i += 1
-            continue
+    results = get_parser(backend)(html)
+    logging.debug(f"Parsed {len(results)} entries")
+    return results
+
+
+def _fetch_pages(
+    base_url: str,
+    pages: int,
+    workers: int = 1,
+    requests_per_second: Optional[float] = None,
+    client: Optional[ScraperClient] = None,
+    start_page: int = 1,
+) -> Iterator[tuple[int, Optional[str]]]:
+    """Fetch survey pages, optionally concurrently, yielding them in page order.
+
+    At most ``2 * workers`` pages are in flight or buffered at any time, so a slow consumer
+    never causes the whole crawl to pile up in memory.
+
+    Args:
+        base_url: Base URL without page param.
+        pages: Last page number to fetch.
+        workers: Number of concurrent fetch threads. 1 fetches sequentially.
+        requests_per_second: Global request rate limit shared by all workers (None for no limit).
+        client: Client whose connection pool is shared by all workers (None for the default).
+        start_page: First page number to fetch.
+
+    Yields:
+        Tuples of (page number, HTML content or None if the fetch failed).
+    """
+    limiter = _RateLimiter(requests_per_second)
+
+    def fetch(page_num: int) -> Optional[str]:
+        limiter.wait()
+        logging.info(f"Scraping page {page_num}/{pages}")
+        url = f"{base_url}?page={page_num}&order=latest"
+        return _fetch_page(url) if client is None else client.fetch(url)
+
+    if workers <= 1:
+        for page_num in range(start_page, pages + 1):
+            yield page_num, fetch(page_num)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gradcafe-fetch") as executor:
+        in_flight: deque[tuple[int, Future[Optional[str]]]] = deque()
+        next_page = start_page
+        try:
+            while next_page <= pages or in_flight:
+                while next_page <= pages and len(in_flight) < 2 * workers:
+                    in_flight.append((next_page, executor.submit(fetch, next_page)))
+                    next_page += 1
+                page_num, future = in_flight.popleft()
+                yield page_num, future.result()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+
+def _parse_pages(
+    fetched: Iterator[tuple[int, Optional[str]]],
+    parse_workers: int = 0,
+    parser: Optional[str] = None,
+) -> Iterator[tuple[int, Optional[list[dict[str, Any]]]]]:
+    """Parse fetched pages in page order, optionally in a pool of worker processes.
+
+    With ``parse_workers`` > 0 each page's HTML is handed to a ProcessPoolExecutor running
+    _parse_html, so CPU-bound parsing is not limited by the GIL and the main process keeps
+    pulling (and the fetch threads keep fetching) pages meanwhile. At most
+    ``2 * parse_workers`` pages are queued for parsing at any time.
+
+    Args:
+        fetched: Tuples of (page number, HTML or None) in page order.
+        parse_workers: Number of parser processes. 0 parses in the calling process.
+        parser: Parser backend passed to _parse_html (None for the "bs4" default).
 
-        tds = row.find_all("td")
-        if len(tds) < 5:
-            i += 1
+    Yields:
+        Tuples of (page number, raw entries or None if the fetch failed) in page order.
+
+    Raises:
+        ValueError: If the parser backend is unknown or not installed, before any page is
+            fetched.
+    """
+    get_parser(parser)
+    if parse_workers <= 0:
+        for page_num, html in fetched:
+            yield page_num, None if html is None else _parse_html(html, parser)
+        return
+
+    # "spawn" keeps the worker processes safe to start while fetch threads are running
+    with ProcessPoolExecutor(
+        max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        pending: deque[tuple[int, Optional[Future[list[dict[str, Any]]]]]] = deque()
+        try:
+            for page_num, html in fetched:
+                future = None if html is None else executor.submit(_parse_html, html, parser)
+                pending.append((page_num, future))
+                # Hand back every page that is ready, and block once the queue is full
+                while pending and (
+                    len(pending) > 2 * parse_workers or pending[0][1] is None
+                    or pending[0][1].done()
+                ):
+                    done_page, future = pending.popleft()
+                    yield done_page, None if future is None else future.result()
+            while pending:
+                done_page, future = pending.popleft()
+                yield done_page, None if future is None else future.result()
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+
+
+def iter_numbered_pages(
+    base_url: str = "https://www.thegradcafe.com/survey/",
+    pages: int = 10,
+    workers: int = 1,
+    requests_per_second: Optional[float] = None,
+    client: Optional[ScraperClient] = None,
+    start_page: int = 1,
+    known_urls: Optional[Container[str]] = None,
+    parse_workers: int = 0,
+    parser: Optional[str] = None,
+) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    """Scrape GradCafe lazily, yielding each page's raw entries together with its page number.
+
+    When ``known_urls`` is given the crawl is incremental: entries whose URL is already known are
+    dropped, and paging stops at the first page made up entirely of known entries. With
+    ``order=latest`` everything past that page has been seen before.
+
+    Args:
+        base_url: Base URL without page param.
+        pages: Last page number to scrape.
+        workers: Number of pages fetched concurrently. Batches are still yielded in page order.
+        requests_per_second: Global request rate limit across all workers (None for no limit).
+        client: Client whose connection pool is reused for every page (None for the default).
+        start_page: First page number to scrape, e.g. to resume an interrupted crawl.
+        known_urls: Raw entry URLs (as scraped, e.g. "/result/123") that are already saved.
+        parse_workers: Number of processes parsing pages in parallel (0 parses in-process).
+        parser: HTML parser backend ("bs4", "lxml" or "selectolax"). None uses "bs4".
+
+    Yields:
+        Tuples of (page number, raw entries) for each successfully fetched page.
+    """
+    total = 0
+    fetched = _fetch_pages(base_url, pages, workers, requests_per_second, client, start_page)
+    for page_num, page_data in _parse_pages(fetched, parse_workers, parser):
+        if page_data is None:
+            logging.warning(f"Skipping page {page_num} due to fetch failure")
             continue
+        if known_urls is not None:
+            new_data = [entry for entry in page_data if entry.get("url") not in known_urls]
+            if not new_data:
+                logging.info(f"Page {page_num} holds no new entries; stopping incremental crawl")
+                break
+            page_data = new_data
+        total += len(page_data)
+        yield page_num, page_data
+    logging.info(f"Total entries scraped: {total}")
 
-        university = tds[0].get_text(strip=True)
-        spans = tds[1].find_all("span")
-        program_name = spans[0].get_text(strip=True) if spans else ""
-        degree = spans[1].get_text(strip=True) if len(spans) > 1 else ""
-        date_added = tds[2].get_text(strip=True)
-        status = tds[3].get_text(strip=True)
-        a_tag = row.find("a")
-        url = a_tag["href"] if a_tag and "href" in a_tag.attrs else ""  # type: ignore
-
-        # Collect tags and comments from subsequent rows
-        tag_texts: list[str] = []
-        comments = ""
-        j = i + 1
-        while j < len(rows) and "tw-border-none" in rows[j].get("class", []):
-            tag_divs = rows[j].select("div.tw-inline-flex")
-            if tag_divs:
-                tag_texts.extend([d.get_text(strip=True) for d in tag_divs])
-            else:
-                comments = rows[j].get_text(strip=True)
-            j += 1
-
-        results.append({
-            "university": university,
-            "program_name": program_name,
-            "degree": degree,
-            "date_added": date_added,
-            "status": status,
-            "url": url,
-            "tags": tag_texts,
-            "comments": comments,
-        })
-        i = j
 
-    logging.debug(f"Parsed {len(results)} entries")
-    return results
+def iter_scrape_pages(
+    base_url: str = "https://www.thegradcafe.com/survey/",
+    pages: int = 10,
+    workers: int = 1,
+    requests_per_second: Optional[float] = None,
+    client: Optional[ScraperClient] = None,
+    parse_workers: int = 0,
+    parser: Optional[str] = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """Scrape GradCafe lazily, yielding the raw entries of one page at a time.
+
+    Only the page being consumed (plus the small fetch-ahead window) is held in memory, so the
+    crawl size does not affect peak memory.
+
+    Args:
+        base_url: Base URL without page param.
+        pages: Number of pages to scrape.
+        workers: Number of pages fetched concurrently. Batches are still yielded in page order.
+        requests_per_second: Global request rate limit across all workers (None for no limit).
+        client: Client whose connection pool is reused for every page (None for the default).
+        parse_workers: Number of processes parsing pages in parallel (0 parses in-process).
+        parser: HTML parser backend ("bs4", "lxml" or "selectolax"). None uses "bs4".
+
+    Yields:
+        List of raw entries parsed from each successfully fetched page.
+    """
+    for _, page_data in iter_numbered_pages(
+        base_url,
+        pages,
+        workers,
+        requests_per_second,
+        client,
+        parse_workers=parse_workers,
+        parser=parser,
+    ):
+        yield page_data
 
 
 def scrape_data(
     base_url: str = "https://www.thegradcafe.com/survey/",
     pages: int = 10,
+    workers: int = 1,
+    requests_per_second: Optional[float] = None,
+    client: Optional[ScraperClient] = None,
+    parse_workers: int = 0,
+    parser: Optional[str] = None,
 ) -> list[dict[str, Any]]:
     """Scrape multiple pages from GradCafe dynamically.
 
     Args:
         base_url: Base URL without page param.
         pages: Number of pages to scrape.
+        workers: Number of pages fetched concurrently. Results are still returned in page order.
+        requests_per_second: Global request rate limit across all workers (None for no limit).
+        client: Client whose connection pool is reused for every page (None for the default).
+        parse_workers: Number of processes parsing pages in parallel (0 parses in-process).
+        parser: HTML parser backend ("bs4", "lxml" or "selectolax"). None uses "bs4".
 
     Returns:
         Combined list of raw scraped entries.
     """
     all_data: list[dict[str, Any]] = []
-    for page_num in range(1, pages + 1):
-        url = f"{base_url}?page={page_num}&order=latest"
-        logging.info(f"Scraping page {page_num}/{pages}")
-        html = _fetch_page(url)
-        if html is None:
-            logging.warning(f"Skipping page {page_num} due to fetch failure")
-            continue
-        page_data = _parse_html(html)
+    for page_data in iter_scrape_pages(
+        base_url, pages, workers, requests_per_second, client, parse_workers, parser
+    ):
         all_data.extend(page_data)
-    logging.info(f"Total entries scraped: {len(all_data)}")
     return all_data
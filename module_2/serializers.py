@@ -0,0 +1,224 @@
+"""
+Module: serializers.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Interchangeable JSON serializers for saving and loading applicant data.
+
+Backends, fastest first:
+- "msgspec": msgspec's JSON encoder and decoder, used when it is installed. Applicant records
+  are decoded straight into the typed ApplicantStruct.
+- "orjson": orjson, used when it is installed.
+- "json": the standard library (always available, the reference).
+
+module_5's src/utils/serializers.py has the same API and backend order. Every backend reads and
+writes the same JSON. The fast backends write non-ASCII characters as UTF-8 where the standard
+library escapes them (e.g. "é" instead of "\\u00e9"); both forms decode to the same data.
+
+loads decodes any JSON document. load_records and load_record decode applicant records: plain
+dictionaries, or ApplicantStruct objects with msgspec, read with the same record.get(...) calls.
+Scores and GPAs may be strings or numbers.
+
+Decoding errors are always raised as json.JSONDecodeError and encoding errors as TypeError. A
+records document that is not a list, a record that is not an object, or (with msgspec) a field
+of the wrong type raises ValueError.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Backends in order of preference when none is requested explicitly
+BACKEND_PREFERENCE = ("msgspec", "orjson", "json")
+
+# Scores and GPAs are saved as text by the scraper, but other tools write them as numbers
+Score = str | float | None
+
+# Only defined when msgspec is installed; _msgspec_serializer is the only code that uses it
+if msgspec is not None:
+
+    class ApplicantStruct(msgspec.Struct):
+        """Typed applicant record with the fields of a cleaned entry."""
+        university: Optional[str] = None
+        program_name: Optional[str] = None
+        date_added: Optional[str] = None
+        term: Optional[str] = None
+        status: Optional[str] = None
+        decision_date: Optional[str] = None
+        comments: Optional[str] = None
+        us_international: Optional[str] = None
+        gre_score: Score = None
+        gre_v_score: Score = None
+        gre_q_score: Score = None
+        gre_aw_score: Score = None
+        degree: Optional[str] = None
+        gpa: Score = None
+        url: Optional[str] = None
+        gre: Score = None
+        gre_v: Score = None
+        gre_aw: Score = None
+        us_or_international: Optional[str] = None
+
+        def get(self, key: str, default: Any = None) -> Any:
+            """Read a field like dict.get, so callers treat structs and dictionaries alike."""
+            value = getattr(self, key, None)
+            return default if value is None else value
+
+
+class Serializer:
+    """JSON encode/decode functions of one backend, all working on UTF-8 bytes."""
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        dumps_pretty: Callable[[Any], bytes],
+        loads: Callable[[bytes | str], Any],
+        load_records: Callable[[bytes | str], list[Any]],
+        load_record: Callable[[bytes | str], Any],
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            name: Backend name.
+            dumps: Encodes an object as compact JSON.
+            dumps_pretty: Encodes an object as JSON indented by two spaces, like
+                json.dumps(obj, indent=2).
+            loads: Decodes any JSON document.
+            load_records: Decodes a JSON array of applicant records.
+            load_record: Decodes one applicant record (a JSON Lines line).
+        """
+        self.name = name
+        self.dumps = dumps
+        self.dumps_pretty = dumps_pretty
+        self.loads = loads
+        self.load_records = load_records
+        self.load_record = load_record
+
+    def __repr__(self) -> str:
+        return f"Serializer({self.name!r})"
+
+
+def _check_records(data: Any) -> list[Any]:
+    if not isinstance(data, list) or not all(isinstance(record, dict) for record in data):
+        raise ValueError("Expected a list of dictionaries.")
+    return data
+
+
+def _check_record(record: Any) -> Any:
+    if not isinstance(record, dict):
+        raise ValueError("Expected a JSON object.")
+    return record
+
+
+def _json_serializer() -> Serializer:
+    return Serializer(
+        "json",
+        lambda obj: json.dumps(obj).encode("utf-8"),
+        lambda obj: json.dumps(obj, indent=2).encode("utf-8"),
+        json.loads,
+        lambda data: _check_records(json.loads(data)),
+        lambda line: _check_record(json.loads(line)),
+    )
+
+
+def _orjson_serializer() -> Serializer:
+    # orjson.JSONDecodeError and orjson.JSONEncodeError already subclass the stdlib errors
+    return Serializer(
+        "orjson",
+        orjson.dumps,
+        lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2),
+        orjson.loads,
+        lambda data: _check_records(orjson.loads(data)),
+        lambda line: _check_record(orjson.loads(line)),
+    )
+
+
+def _msgspec_serializer() -> Serializer:
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    records_decoder = msgspec.json.Decoder(list[ApplicantStruct])
+    record_decoder = msgspec.json.Decoder(ApplicantStruct)
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return encoder.encode(obj)
+        except msgspec.EncodeError as e:
+            raise TypeError(str(e)) from e
+
+    def dumps_pretty(obj: Any) -> bytes:
+        return msgspec.json.format(dumps(obj), indent=2)
+
+    def decode(typed_decoder: Any, data: bytes | str) -> Any:
+        try:
+            return typed_decoder.decode(data)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid applicant record: {e}") from e
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    return Serializer(
+        "msgspec",
+        dumps,
+        dumps_pretty,
+        lambda data: decode(decoder, data),
+        lambda data: decode(records_decoder, data),
+        lambda line: decode(record_decoder, line),
+    )
+
+
+_FACTORIES: dict[str, Callable[[], Serializer]] = {
+    "json": _json_serializer,
+    "orjson": _orjson_serializer,
+    "msgspec": _msgspec_serializer,
+}
+_serializers: dict[str, Serializer] = {}
+
+
+def available_serializers() -> list[str]:
+    """List the serializer backends whose dependencies are installed, fastest first.
+
+    Returns:
+        Backend names in order of preference.
+    """
+    installed = {
+        "json": True,
+        "orjson": orjson is not None,
+        "msgspec": msgspec is not None,
+    }
+    return [name for name in BACKEND_PREFERENCE if installed[name]]
+
+
+def get_serializer(backend: Optional[str] = None) -> Serializer:
+    """Return the serializer for a backend.
+
+    Args:
+        backend: Backend name ("json", "orjson" or "msgspec"). Defaults to the JSON_SERIALIZER
+            environment variable, then to the fastest installed backend.
+
+    Returns:
+        The backend's Serializer.
+
+    Raises:
+        ValueError: If the backend is unknown or its dependency is not installed.
+    """
+    backend = backend or os.getenv("JSON_SERIALIZER") or available_serializers()[0]
+    if backend not in _FACTORIES:
+        raise ValueError(f"Unknown serializer backend: {backend}")
+    if backend not in available_serializers():
+        raise ValueError(f"Serializer backend '{backend}' is not installed.")
+    if backend not in _serializers:
+        logging.debug(f"Using '{backend}' JSON serializer backend")
+        _serializers[backend] = _FACTORIES[backend]()
+    return _serializers[backend]
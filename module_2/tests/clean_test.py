@@ -7,10 +7,15 @@ Description: Unit tests for clean.py module using pytest.
 Note: Private functions (with leading underscore) are imported here **only for testing purposes**.
 """
 
-from typing import Any
+import json
+from typing import Any, Optional
 import pytest
 
-from ..clean import clean_data, _parse_status_date, _parse_tags, save_data  # type: ignore
+from ..clean import (  # type: ignore
+    clean_columns, clean_data, clean_data_batch, clean_data_parallel, crawl, iter_clean_data,
+    iter_data, load_data, _parse_status_date, _parse_tags, save_data, save_data_stream
+)
+from ..serializers import available_serializers, get_serializer  # type: ignore
 
 
 @pytest.mark.parametrize(
@@ -40,6 +45,25 @@ def test_parse_tags(tags_list: list[str], expected: set[str]) -> None:
     assert _parse_tags(tags_list) == expected
 
 
+@pytest.mark.parametrize(
+    "tag, field, value",
+    [
+        ("Fall 2025", "term", "Fall 2025"),
+        ("US Citizen", "us_international", "American"),
+        ("Int'l", "us_international", "International"),
+        ("GRE 320", "gre_score", "320"),
+        ("GRE V: 160", "gre_v_score", "160"),
+        ("GRE Q 168", "gre_q_score", "168"),
+        ("GRE AW 4.5", "gre_aw_score", "4.5"),
+        ("GPA: 3.85", "gpa", "3.85"),
+    ],
+)
+def test_parse_tags_classifies_each_field(tag: str, field: str, value: str) -> None:
+    info = _parse_tags(["Masters", tag, "Fall 2025 cohort"])
+    assert info[field] == value
+    assert all(v == "" for k, v in info.items() if k != field)
+
+
 def test_clean_data_basic() -> None:
     raw_entries = [ # type: ignore
         {
@@ -115,3 +139,295 @@ def test_save_data_creates_file(tmp_path) -> None:  # type: ignore
 def test_save_data_no_data() -> None:
     result = save_data([], base_filename="should_not_exist.json")  # type: ignore
     assert result is None
+
+
+def _raw_entry(n: int) -> dict[str, Any]:
+    return {
+        "university": f"Uni {n}",
+        "program_name": "Computer Science",
+        "degree": "Masters",
+        "date_added": "June 01, 2025",
+        "status": "Accepted on 1 Jun",
+        "url": f"/result/{n}",
+        "tags": ["Fall 2025", "International", "GPA 3.80"],
+        "comments": "Line one\nline   two",
+    }
+
+
+def test_iter_clean_data_is_lazy_and_matches_clean_data() -> None:
+    consumed: list[int] = []
+
+    def batches() -> Any:
+        for page in range(3):
+            consumed.append(page)
+            yield [_raw_entry(page * 2), _raw_entry(page * 2 + 1)]
+
+    stream = iter_clean_data(batches())
+    assert consumed == []
+    first = next(stream)
+    assert consumed == [0]
+    cleaned = first + [record for batch in stream for record in batch]
+    assert cleaned == clean_data([_raw_entry(n) for n in range(6)])
+
+
+def test_clean_data_batch_matches_clean_data() -> None:
+    raw = [_raw_entry(n) for n in range(4)]
+    raw[1].update(status="Rejected on 2 Jun", tags=["GRE 320", "gre v 160", "American"],
+                  comments="<p>Caf\\u00e9 <b>visit</b></p>\r\n")
+    raw[2].update(status=None, tags=["Spring 2026", "Fall 2025"], comments="Tr\u00e8s bien \\")
+    raw[3] = {"url": "/result/3"}
+    assert clean_data_batch(raw) == clean_data(raw)
+    assert clean_data_batch([]) == []
+
+
+def test_clean_columns_treats_missing_columns_as_empty() -> None:
+    columns = clean_columns({"url": ["/result/1", "/result/2"]})
+    assert columns["url"] == ["https://www.thegradcafe.com/result/1",
+                              "https://www.thegradcafe.com/result/2"]
+    assert columns["comments"] == ["", ""]
+    assert columns["decision_date"] == [None, None]
+
+
+def test_clean_data_parallel_keeps_order() -> None:
+    raw = [_raw_entry(n) for n in range(10)]
+    assert clean_data_parallel(raw, workers=2, chunk_size=3) == clean_data(raw)
+    assert clean_data_parallel(raw, workers=1, chunk_size=3) == clean_data(raw)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(0, 10), (2, 0)])
+def test_clean_data_parallel_rejects_bad_sizes(workers: int, chunk_size: int) -> None:
+    with pytest.raises(ValueError):
+        clean_data_parallel([_raw_entry(0)], workers=workers, chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("batch_sizes", [[3], [1, 0, 2], [0, 0]])
+def test_save_data_stream_matches_json_dump(tmp_path, batch_sizes: list[int]) -> None:  # type: ignore
+    records = clean_data([_raw_entry(n) for n in range(sum(batch_sizes))])
+    batches: list[list[dict[str, Any]]] = []
+    start = 0
+    for size in batch_sizes:
+        batches.append(records[start:start + size])  # type: ignore
+        start += size
+
+    filename = tmp_path / "applicant_data.json"  # type: ignore
+    assert save_data_stream(iter(batches), str(filename)) == len(records)  # type: ignore
+    if records:
+        assert filename.read_text(encoding="utf-8") == json.dumps(records, indent=2)  # type: ignore
+    else:
+        # Nothing scraped: the previous file must not be clobbered
+        assert not filename.exists()  # type: ignore
+    assert not (tmp_path / "applicant_data.json.part").exists()  # type: ignore
+
+
+def test_save_data_stream_rejects_non_dict_records(tmp_path) -> None:  # type: ignore
+    filename = tmp_path / "applicant_data.json"  # type: ignore
+    filename.write_text("[]", encoding="utf-8")  # type: ignore
+    assert save_data_stream(iter([[{"url": "a"}], ["oops"]]), str(filename)) is None  # type: ignore
+    assert filename.read_text(encoding="utf-8") == "[]"  # type: ignore
+    assert not (tmp_path / "applicant_data.json.part").exists()  # type: ignore
+
+
+@pytest.mark.parametrize("name", ["applicant_data.jsonl", "applicant_data.ndjson"])
+def test_json_lines_round_trip(tmp_path, name: str) -> None:  # type: ignore
+    records = clean_data([_raw_entry(n) for n in range(3)])
+    filename = str(tmp_path / name)  # type: ignore
+
+    assert save_data(records, filename)
+    with open(filename, encoding="utf-8") as file:
+        assert [json.loads(line) for line in file] == records
+    assert load_data(filename) == records
+
+    assert save_data_stream(iter([records[:2], records[2:]]), filename) == 3
+    assert list(iter_data(filename)) == records
+
+
+def test_iter_data_streams_json_lines(tmp_path) -> None:  # type: ignore
+    filename = tmp_path / "applicant_data.jsonl"  # type: ignore
+    filename.write_text('{"url": "a"}\n\n{"url": "b"}\nnot json\n', encoding="utf-8")  # type: ignore
+
+    records = iter_data(str(filename))
+    assert next(records) == {"url": "a"}
+    assert next(records) == {"url": "b"}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+    assert load_data(str(filename)) is None
+
+
+def test_load_data_rejects_non_dict_lines(tmp_path) -> None:  # type: ignore
+    filename = tmp_path / "applicant_data.jsonl"  # type: ignore
+    filename.write_text('{"url": "a"}\n[1, 2]\n', encoding="utf-8")  # type: ignore
+    assert load_data(str(filename)) is None
+
+
+@pytest.mark.parametrize("serializer", available_serializers())
+@pytest.mark.parametrize("name", ["applicant_data.json", "applicant_data.jsonl"])
+def test_serializers_round_trip(tmp_path, serializer: str, name: str) -> None:  # type: ignore
+    records = clean_data([_raw_entry(n) for n in range(3)])
+    records[1]["comments"] = "Très bien \u2019 \"quoted\""
+    filename = str(tmp_path / name)  # type: ignore
+
+    assert save_data(records, filename, serializer=serializer)
+    assert load_data(filename, serializer="json") == records
+    for backend in available_serializers():
+        assert list(iter_data(filename, serializer=backend)) == records
+
+    assert save_data_stream(iter([records]), filename, serializer=serializer) == 3
+    assert load_data(filename, serializer="json") == records
+
+
+@pytest.mark.parametrize("serializer", available_serializers())
+def test_serializers_share_error_types(serializer: str) -> None:
+    backend = get_serializer(serializer)
+    assert backend.dumps_pretty({"a": [1]}) == json.dumps({"a": [1]}, indent=2).encode("utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads(b"not json")
+    with pytest.raises(TypeError):
+        backend.dumps({"a": object()})
+
+
+@pytest.mark.parametrize("serializer", available_serializers())
+def test_escaped_emoji_comments_save_with_every_serializer(tmp_path, serializer: str) -> None:  # type: ignore
+    records = clean_data([_raw_entry(0)])
+    records[0]["comments"] = clean_data([{"comments": "Yay \\ud83d\\ude2c \\ud83d"}])[0]["comments"]
+    assert records[0]["comments"] == "Yay \U0001f62c \ufffd"
+
+    filename = str(tmp_path / "applicant_data.json")  # type: ignore
+    assert save_data(records, filename, serializer=serializer)
+    assert load_data(filename) == records
+
+
+@pytest.mark.parametrize("serializer", available_serializers())
+def test_serializers_load_numeric_scores(serializer: str) -> None:
+    backend = get_serializer(serializer)
+    record = b'{"url": "https://www.thegradcafe.com/result/1", "gpa": 3.8, "gre_score": 320}'
+    records = backend.load_records(b"[" + record + b"]")
+    for loaded in (records[0], backend.load_record(record)):
+        assert loaded.get("gpa") == 3.8
+        assert loaded.get("gre_score") == 320
+        assert loaded.get("term") is None
+        if serializer == "msgspec":
+            assert type(loaded).__name__ == "ApplicantStruct"
+
+
+@pytest.mark.parametrize("serializer", available_serializers())
+def test_serializers_reject_invalid_records(serializer: str) -> None:
+    backend = get_serializer(serializer)
+    with pytest.raises(ValueError):
+        backend.load_records(b'{"url": "a"}')
+    with pytest.raises(ValueError):
+        backend.load_record(b"[1, 2]")
+    with pytest.raises(json.JSONDecodeError):
+        backend.load_record(b"not json")
+
+
+def test_get_serializer_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        get_serializer("pickle")
+
+
+def _fake_pages(pages: dict[int, list[dict[str, Any]]], fail_after: Optional[int] = None) -> Any:
+    """Builds a stand-in for iter_numbered_pages serving the given pages."""
+    calls: list[dict[str, Any]] = []
+
+    def fake_iter_numbered_pages(**kwargs: Any) -> Any:
+        calls.append(kwargs)
+        known = kwargs["known_urls"]
+        for page_num in range(kwargs["start_page"], kwargs["pages"] + 1):
+            if fail_after is not None and page_num > fail_after:
+                raise ConnectionError("crawler died")
+            entries = pages[page_num]
+            if known is not None:
+                entries = [entry for entry in entries if entry["url"] not in known]
+                if not entries:
+                    return
+            yield page_num, entries
+
+    return fake_iter_numbered_pages, calls
+
+
+def test_crawl_resumes_from_checkpoint(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:  # type: ignore
+    pages = {n: [_raw_entry(2 * n), _raw_entry(2 * n + 1)] for n in range(1, 5)}
+    filename = str(tmp_path / "applicant_data.json")  # type: ignore
+
+    crashing, _ = _fake_pages(pages, fail_after=2)
+    monkeypatch.setattr("module_2.clean.iter_numbered_pages", crashing)
+    assert crawl(filename, pages=4) is None
+    assert json.loads((tmp_path / "applicant_data.json.checkpoint").read_text())["page"] == 2  # type: ignore
+
+    resumed, calls = _fake_pages(pages)
+    monkeypatch.setattr("module_2.clean.iter_numbered_pages", resumed)
+    assert crawl(filename, pages=4) == 8
+    assert calls[0]["start_page"] == 3
+
+    expected = clean_data([entry for n in range(1, 5) for entry in pages[n]])
+    with open(filename, encoding="utf-8") as file:
+        assert file.read() == json.dumps(expected, indent=2)
+    assert not (tmp_path / "applicant_data.json.checkpoint").exists()  # type: ignore
+    assert not (tmp_path / "applicant_data.json.part").exists()  # type: ignore
+
+
+@pytest.mark.parametrize("name", ["applicant_data.json", "applicant_data.jsonl"])
+def test_crawl_resume_skips_entries_shifted_past_checkpoint(  # type: ignore
+    tmp_path, monkeypatch: pytest.MonkeyPatch, name: str
+) -> None:
+    filename = str(tmp_path / name)  # type: ignore
+    pages = {n: [_raw_entry(2 * n), _raw_entry(2 * n + 1)] for n in range(1, 4)}
+    crashing, _ = _fake_pages(pages, fail_after=2)
+    monkeypatch.setattr("module_2.clean.iter_numbered_pages", crashing)
+    assert crawl(filename, pages=3) is None
+
+    # A new post pushed entry 5 from page 2 onto page 3 before the resume
+    shifted = {3: [_raw_entry(5), _raw_entry(6), _raw_entry(7)]}
+    resumed, calls = _fake_pages(shifted)
+    monkeypatch.setattr("module_2.clean.iter_numbered_pages", resumed)
+    assert crawl(filename, pages=3) == 6
+    assert calls[0]["known_urls"] is None
+
+    with open(filename, encoding="utf-8") as file:
+        text = file.read()
+    records = json.loads(text) if name.endswith(".json") else [
+        json.loads(line) for line in text.splitlines()
+    ]
+    assert [record["url"] for record in records] == [
+        f"https://www.thegradcafe.com/result/{n}" for n in range(2, 8)
+    ]
+
+
+def test_crawl_incremental_stops_at_known_page(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:  # type: ignore
+    filename = str(tmp_path / "applicant_data.json")  # type: ignore
+    old_entries = [_raw_entry(n) for n in range(1, 5)]
+    save_data(clean_data(old_entries), filename)
+
+    # Three new entries pushed the old ones down: page 2 is partly new, page 3 is fully known
+    pages = {
+        1: [_raw_entry(101), _raw_entry(100)],
+        2: [_raw_entry(99), _raw_entry(1)],
+        3: [_raw_entry(2), _raw_entry(3)],
+    }
+    fake, calls = _fake_pages(pages)
+    monkeypatch.setattr("module_2.clean.iter_numbered_pages", fake)
+
+    assert crawl(filename, pages=3, incremental=True) == 3
+    assert calls[0]["known_urls"] == {"/result/1", "/result/2", "/result/3", "/result/4"}
+    with open(filename, encoding="utf-8") as file:
+        urls = [record["url"] for record in json.load(file)]
+    assert urls == [f"https://www.thegradcafe.com/result/{n}" for n in (101, 100, 99, 1, 2, 3, 4)]
+    assert len(calls) == 1
+
+    # Nothing new: the file is left as it is
+    assert crawl(filename, pages=3, incremental=True) == 0
+    assert not (tmp_path / "applicant_data.json.part").exists()  # type: ignore
+
+
+def test_crawl_incremental_json_lines(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:  # type: ignore
+    filename = str(tmp_path / "applicant_data.jsonl")  # type: ignore
+    save_data(clean_data([_raw_entry(1), _raw_entry(2)]), filename)
+
+    fake, calls = _fake_pages({1: [_raw_entry(3), _raw_entry(1)], 2: [_raw_entry(2)]})
+    monkeypatch.setattr("module_2.clean.iter_numbered_pages", fake)
+
+    assert crawl(filename, pages=2, incremental=True) == 1
+    assert calls[0]["known_urls"] == {"/result/1", "/result/2"}
+    with open(filename, encoding="utf-8") as file:
+        urls = [json.loads(line)["url"] for line in file]
+    assert urls == [f"https://www.thegradcafe.com/result/{n}" for n in (3, 1, 2)]
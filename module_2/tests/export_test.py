@@ -0,0 +1,69 @@
+"""
+Module: export_test.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Unit tests for export.py module using pytest.
+"""
+
+from datetime import date
+from typing import Any
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from ..clean import clean_data  # type: ignore # noqa: E402
+from ..export import export_data, read_columns  # type: ignore # noqa: E402
+
+
+def _raw_entry(n: int, **fields: Any) -> dict[str, Any]:
+    return {
+        "university": f"Uni {n}",
+        "program_name": "Computer Science",
+        "degree": "Masters",
+        "date_added": "January 10, 2025",
+        "status": "Accepted on 5 Jan",
+        "url": f"/result/{n}",
+        "tags": ["Fall 2025", "International", "GPA 3.80", "GRE 320", "GRE AW 4.5"],
+        "comments": "",
+        **fields,
+    }
+
+
+@pytest.mark.parametrize("name", ["applicant_data.parquet", "applicant_data.arrow"])
+def test_export_data_writes_typed_columns(tmp_path, name: str) -> None:  # type: ignore
+    records = clean_data([
+        _raw_entry(1),
+        _raw_entry(2, status="Rejected on 20 Dec", tags=[]),
+        _raw_entry(3, date_added="", status="Interview", comments="Fingers crossed"),
+    ])
+    filename = str(tmp_path / name)  # type: ignore
+
+    assert export_data(iter(records), filename, batch_size=2) == 3
+
+    table = read_columns(filename)
+    assert table.num_rows == 3
+    assert table.schema.field("gpa").type == pa.float64()
+    assert table.schema.field("date_added").type == pa.date32()
+    assert table.column("gpa").to_pylist() == [3.8, None, 3.8]
+    assert table.column("gre_aw_score").to_pylist() == [4.5, None, 4.5]
+    assert table.column("date_added").to_pylist() == [date(2025, 1, 10), date(2025, 1, 10), None]
+    # A decision later in the year than the date added belongs to the previous year
+    assert table.column("decision_date").to_pylist() == [date(2025, 1, 5), date(2024, 12, 20),
+                                                         None]
+    assert table.column("comments").to_pylist() == [None, None, "Fingers crossed"]
+
+
+@pytest.mark.parametrize("name", ["applicant_data.parquet", "applicant_data.arrow"])
+def test_read_columns_loads_only_requested_columns(tmp_path, name: str) -> None:  # type: ignore
+    filename = str(tmp_path / name)  # type: ignore
+    export_data(clean_data([_raw_entry(n) for n in range(5)]), filename)
+
+    table = read_columns(filename, ["url", "gpa"])
+    assert table.column_names == ["url", "gpa"]
+    assert table.column("url").to_pylist()[0] == "https://www.thegradcafe.com/result/0"
+
+
+def test_export_data_rejects_unknown_extension(tmp_path) -> None:  # type: ignore
+    assert export_data([], str(tmp_path / "applicant_data.csv")) is None  # type: ignore
@@ -7,10 +7,22 @@ Description: Unit tests for scrape.py module using pytest.
 Note: Private functions (with leading underscore) are imported here **only for testing purposes**.
 """
 
-from typing import Any, Optional
+import threading
+import time
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
-from ..scrape import _fetch_page, _parse_html, scrape_data  # type: ignore
+from ..client import HTTP_HEADERS, ScraperClient, get_default_client  # type: ignore
+from ..parsers import (  # type: ignore
+    PARSER_BACKENDS, available_backends, get_parser, parse_with_bs4
+)
+from ..scrape import (  # type: ignore
+    _fetch_page, _parse_html, iter_numbered_pages, iter_scrape_pages, scrape_data
+)
 
 
 @pytest.mark.parametrize(
@@ -34,7 +46,7 @@ def test_fetch_page(
     ) -> DummyResponse:
         return DummyResponse(status_code, data)
 
-    monkeypatch.setattr("module_2.scrape.urllib3.PoolManager.request", dummy_request)
+    monkeypatch.setattr("module_2.client.urllib3.PoolManager.request", dummy_request)
     result: Optional[str] = _fetch_page("http://example.com")
     assert result == expected
 
@@ -44,7 +56,7 @@ def test_fetch_page_exception(monkeypatch: pytest.MonkeyPatch) -> None:
     def dummy_request(method: str, url: str, headers: Optional[dict[str, str]] = None) -> None:
         raise Exception("Network error")
 
-    monkeypatch.setattr("module_2.scrape.urllib3.PoolManager.request", dummy_request)
+    monkeypatch.setattr("module_2.client.urllib3.PoolManager.request", dummy_request)
     result: Optional[str] = _fetch_page("http://example.com")
     assert result is None
 
@@ -139,7 +151,7 @@ def test_scrape_data_success(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_fetch_page(url: str) -> Optional[str]:
         return fake_htmls.pop(0) if fake_htmls else None
 
-    def fake_parse_html(html: str) -> list[dict[str, Any]]:
+    def fake_parse_html(html: str, backend: Optional[str] = None) -> list[dict[str, Any]]:
         return fake_parsed.pop(0) if fake_parsed else []
 
     monkeypatch.setattr("module_2.scrape._fetch_page", fake_fetch_page)
@@ -158,7 +170,7 @@ def test_scrape_data_skip_failed_page(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_fetch_page(url: str) -> Optional[str]:
         return fetch_results.pop(0)  # type: ignore
 
-    def fake_parse_html(html: str) -> list[dict[str, Any]]:
+    def fake_parse_html(html: str, backend: Optional[str] = None) -> list[dict[str, Any]]:
         return parse_results.pop(0)
 
     monkeypatch.setattr("module_2.scrape._fetch_page", fake_fetch_page)
@@ -170,3 +182,209 @@ def test_scrape_data_skip_failed_page(monkeypatch: pytest.MonkeyPatch) -> None:
     # Universities from page 1 and 3
     unis = {entry["university"] for entry in results}
     assert unis == {"U1", "U3"}
+
+
+def _survey_page_html(page_num: int) -> str:
+    return f"""
+    <html><body><table class="tw-min-w-full">
+      <tbody>
+        <tr>
+          <td>University {page_num}</td>
+          <td><span>Program</span><span>PhD</span></td>
+          <td>2025-01-01</td>
+          <td>Accepted on 2025-05-01</td>
+          <td><a href="/result/{page_num}"></a></td>
+        </tr>
+      </tbody>
+    </table></body></html>
+    """
+
+
+@pytest.fixture
+def survey_server() -> Iterator[str]:
+    """Local stand-in for the GradCafe survey endpoint; later pages respond faster."""
+
+    class SurveyHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self) -> None:
+            page_num = int(parse_qs(urlparse(self.path).query)["page"][0])
+            if page_num == 3:
+                self.send_response(404)
+                self.end_headers()
+                return
+            time.sleep(0.05 / page_num)
+            body = _survey_page_html(page_num).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SurveyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/survey/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scrape_data_concurrent_keeps_page_order(survey_server: str, workers: int) -> None:
+    results = scrape_data(base_url=survey_server, pages=6, workers=workers)
+    # Page 3 returns HTTP 404 and is skipped; the rest must come back in page order
+    assert [entry["university"] for entry in results] == [
+        "University 1", "University 2", "University 4", "University 5", "University 6"
+    ]
+    assert results[0]["url"] == "/result/1"
+
+
+def test_scrape_data_respects_rate_limit(survey_server: str) -> None:
+    start = time.monotonic()
+    scrape_data(base_url=survey_server, pages=5, workers=4, requests_per_second=20)
+    # 5 requests at 20 req/s need at least 4 full intervals of 0.05s, regardless of workers
+    assert time.monotonic() - start >= 0.2
+
+
+def test_scrape_data_reuses_given_client(survey_server: str) -> None:
+    with ScraperClient(pool_size=2, retries=0) as client:
+        results = scrape_data(base_url=survey_server, pages=2, workers=2, client=client)
+    assert [entry["university"] for entry in results] == ["University 1", "University 2"]
+
+
+def test_default_client_is_shared() -> None:
+    assert get_default_client() is get_default_client()
+
+
+def test_client_sends_scraper_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: dict[str, Any] = {}
+
+    def dummy_request(
+        self: Any, method: str, url: str, headers: Optional[dict[str, str]] = None
+    ) -> None:
+        sent["headers"] = headers
+
+    monkeypatch.setattr("module_2.client.urllib3.PoolManager.request", dummy_request)
+    ScraperClient().request("http://example.com")
+    assert sent["headers"] == HTTP_HEADERS
+
+
+def test_iter_scrape_pages_yields_one_batch_per_page(survey_server: str) -> None:
+    batches = iter_scrape_pages(base_url=survey_server, pages=4, workers=2)
+    assert [entry["university"] for entry in next(batches)] == ["University 1"]
+    # Page 3 fails and is skipped without ending the stream
+    assert [[entry["university"] for entry in batch] for batch in batches] == [
+        ["University 2"], ["University 4"]
+    ]
+
+
+def test_iter_numbered_pages_stops_at_fully_known_page(survey_server: str) -> None:
+    pages = iter_numbered_pages(
+        base_url=survey_server, pages=6, start_page=2, known_urls={"/result/4", "/result/5"}
+    )
+    # Page 3 fails and is skipped; page 4 is entirely known, so paging stops there
+    assert [(page_num, [entry["url"] for entry in entries]) for page_num, entries in pages] == [
+        (2, ["/result/2"])
+    ]
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.parametrize("backend", sorted(PARSER_BACKENDS))
+def test_parser_backends_match_bs4_on_fixture(backend: str) -> None:
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+    html = (FIXTURES_DIR / "survey_page.html").read_text(encoding="utf-8")
+    expected = parse_with_bs4(html)
+    assert len(expected) == 20
+    assert _parse_html(html, backend=backend) == expected
+
+
+@pytest.mark.parametrize("backend", sorted(PARSER_BACKENDS))
+def test_parser_backends_match_bs4_on_malformed_fixture(backend: str) -> None:
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+    html = (FIXTURES_DIR / "malformed_survey_page.html").read_text(encoding="utf-8")
+    expected = parse_with_bs4(html)
+    assert [entry["url"] for entry in expected] == ["/result/900001", "", ""]
+    assert expected[0]["tags"] == ["Fall 2025", "International"]
+    assert expected[0]["comments"] == "Funded & happy<3Second paragraph"
+    assert _parse_html(html, backend=backend) == expected
+
+
+def test_parse_html_defaults_to_bs4() -> None:
+    assert get_parser() is parse_with_bs4
+    # No explicit <tbody>: html.parser finds no results rows, unlike the HTML5 tree builders
+    html = (
+        '<table class="tw-min-w-full"><tr><td>Uni</td><td><span>CS</span></td><td>d</td>'
+        '<td>s</td><td><a href="/r/1"></a></td></tr></table>'
+    )
+    assert _parse_html(html) == []
+
+
+def test_parse_html_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        _parse_html("<html></html>", backend="regex")
+
+
+@pytest.mark.parametrize("backend", sorted(PARSER_BACKENDS))
+def test_parse_html_folds_detail_rows_into_preceding_entry(backend: str) -> None:
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+    html = """
+    <html><body><table class="tw-min-w-full"><tbody>
+      <tr class="tw-border-none"><td>Orphan before any entry</td></tr>
+      <tr><td>Uni</td><td><span>Prog</span></td><td>d</td><td>s</td><td><a href="/r/1"></a></td></tr>
+      <tr class="tw-border-none"><td><div class="tw-inline-flex">Fall 2025</div></td></tr>
+      <tr class="tw-border-none"><td>First comment</td></tr>
+      <tr class="tw-border-none"><td><div class="tw-inline-flex">GPA 3.9</div></td></tr>
+      <tr class="tw-border-none"><td>Last comment wins</td></tr>
+      <tr><td>Malformed row</td></tr>
+      <tr class="tw-border-none"><td>Dropped with the malformed row</td></tr>
+    </tbody></table></body></html>
+    """
+    assert _parse_html(html, backend=backend) == [{
+        "university": "Uni",
+        "program_name": "Prog",
+        "degree": "",
+        "date_added": "d",
+        "status": "s",
+        "url": "/r/1",
+        "tags": ["Fall 2025", "GPA 3.9"],
+        "comments": "Last comment wins",
+    }]
+
+
+def test_scrape_data_parses_in_worker_processes(survey_server: str) -> None:
+    serial = scrape_data(base_url=survey_server, pages=8, workers=4)
+    parallel = scrape_data(base_url=survey_server, pages=8, workers=4, parse_workers=2)
+    assert parallel == serial
+    assert [entry["url"] for entry in parallel] == [f"/result/{n}" for n in (1, 2, 4, 5, 6, 7, 8)]
+
+
+@pytest.mark.parametrize("parse_workers", [0, 2])
+@pytest.mark.parametrize("backend", sorted(PARSER_BACKENDS))
+def test_scrape_data_uses_chosen_parser(
+    survey_server: str, backend: str, parse_workers: int
+) -> None:
+    if backend not in available_backends():
+        pytest.skip(f"{backend} is not installed")
+    expected = scrape_data(base_url=survey_server, pages=4, workers=2)
+    assert scrape_data(
+        base_url=survey_server, pages=4, workers=2, parse_workers=parse_workers, parser=backend
+    ) == expected
+
+
+def test_scrape_data_rejects_unknown_parser_before_fetching(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+
+    def fail_fetch(url: str, client: Optional[ScraperClient] = None) -> None:
+        raise AssertionError("no page should be fetched")
+
+    monkeypatch.setattr("module_2.scrape._fetch_page", fail_fetch)
+    with pytest.raises(ValueError):
+        scrape_data(pages=2, parser="regex")
@@ -2,7 +2,7 @@
 Module: app.py
 Author: Billy Presume
 Created: 2025-06-04
-Modified: 2025-06-17
+Modified: 2026-10-18
 Description: Entry point for running the Flask application.
 """
 
@@ -64,8 +64,11 @@ def find_free_port(default: int = 5000, max_tries: int = 100) -> int:
     raise RuntimeError("No free port found.")
 
 
+# Module-level app for `flask run` (FLASK_APP=app.py) and WSGI servers (e.g. gunicorn app:app).
+# create_app does not open the connection pool in the loader's worker processes, which import
+# this module again when it is the one being run.
 app: Flask = create_app()
 
+
 if __name__ == "__main__":
-    port: int = find_free_port()
-    app.run(debug=True, use_reloader=True, host="0.0.0.0", port=port)
+    app.run(debug=True, use_reloader=True, host="0.0.0.0", port=find_free_port())
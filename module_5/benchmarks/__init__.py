@@ -0,0 +1,8 @@
+"""
+Module: __init__.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Makes the benchmarks directory a package so each benchmark runs with
+             `python -m benchmarks.<name>` from the module_5 directory.
+"""
@@ -0,0 +1,126 @@
+"""
+Module: loader_benchmark.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+
+Description:
+    Compares the per-row INSERT, batched executemany and COPY load methods of load_applicants
+    on a local PostgreSQL database. With --files N the records are also split over N files and
+    loaded by load_applicant_files, one file at a time and then with --workers parallel workers.
+
+    The benchmark works in a throwaway schema (loader_benchmark) that is dropped afterwards, so
+    the real applicants table is never touched. It connects with the DB_* settings from .env,
+    or with --dsn.
+
+Usage (from module_5):
+    python -m benchmarks.loader_benchmark [--count N] [--chunk-size K] [--dsn DSN]
+        [--files N] [--workers W]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+from psycopg import Connection, connect
+from psycopg.sql import SQL, Identifier
+
+from benchmarks.serializer_benchmark import generate_records
+from src.utils.database import connect_to_database
+from src.utils.serializers import get_serializer
+from src.website.load_data import LOAD_METHODS, load_applicant_files, load_applicants
+
+SCHEMA = "loader_benchmark"
+
+# CASCADE also drops the applicant_summary view that loads build on the table
+DROP_TABLE_QUERY = SQL("DROP TABLE IF EXISTS {} CASCADE").format(Identifier(SCHEMA, "applicants"))
+
+
+def _connect(dsn: Optional[str]) -> Connection:
+    connection = connect(dsn) if dsn else connect_to_database()
+    if connection is None:
+        raise SystemExit("Could not connect to the database; check .env or pass --dsn.")
+    return connection
+
+
+def _time_load(connection: Connection, path: str, method: str, chunk_size: int) -> float:
+    """Load the file into a fresh applicants table in the benchmark schema."""
+    connection.execute(DROP_TABLE_QUERY)
+    connection.commit()
+    start = time.perf_counter()
+    load_applicants(connection, path, method=method, chunk_size=chunk_size)
+    return time.perf_counter() - start
+
+
+def _time_parallel_load(
+    connection: Connection,
+    paths: list[str],
+    workers: int,
+    chunk_size: int,
+    dsn: Optional[str],
+) -> float:
+    """Load the files with load_applicant_files into a fresh applicants table."""
+    connection.execute(DROP_TABLE_QUERY)
+    connection.commit()
+    start = time.perf_counter()
+    load_applicant_files(paths, workers=workers, chunk_size=chunk_size, conninfo=dsn)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Time each load method on the same generated file."""
+    parser = argparse.ArgumentParser(description="Compare load_applicants methods.")
+    parser.add_argument("--count", type=int, default=100_000, help="number of records")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="records per chunk")
+    parser.add_argument("--dsn", help="PostgreSQL connection string (default: .env settings)")
+    parser.add_argument("--files", type=int, default=1, help="files to split the records over")
+    parser.add_argument("--workers", type=int, default=4, help="parallel workers for --files")
+    args = parser.parse_args()
+    # Every connection, including those of the worker processes, works in the benchmark schema
+    os.environ["PGOPTIONS"] = f"-c search_path={SCHEMA}"
+    logging.getLogger("src.website.load_data").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "applicant_data.jsonl")
+        serializer = get_serializer()
+        records = generate_records(args.count)
+        with open(path, "wb") as f:
+            f.writelines(serializer.dumps(record) + b"\n" for record in records)
+        paths = [os.path.join(directory, f"applicant_data_{i}.jsonl") for i in range(args.files)]
+        for i, file_path in enumerate(paths if args.files > 1 else []):
+            with open(file_path, "wb") as f:
+                f.writelines(
+                    serializer.dumps(record) + b"\n" for record in records[i::args.files]
+                )
+
+        with _connect(args.dsn) as connection:
+            connection.execute(SQL("CREATE SCHEMA IF NOT EXISTS {}").format(Identifier(SCHEMA)))
+            connection.execute(SQL("SET search_path TO {}").format(Identifier(SCHEMA)))
+            connection.commit()
+            try:
+                print(f"{args.count:,} records, chunks of {args.chunk_size:,}")
+                print(f"{'method':<14}{'time':>10}{'records/s':>14}")
+                for method in reversed(LOAD_METHODS):
+                    seconds = _time_load(connection, path, method, args.chunk_size)
+                    print(f"{method:<14}{seconds:>9.2f}s{args.count / seconds:>14,.0f}")
+                if args.files > 1:
+                    print(f"\n{args.files} files, copy")
+                    print(f"{'workers':<14}{'time':>10}{'records/s':>14}")
+                    for workers in (1, args.workers):
+                        seconds = _time_parallel_load(
+                            connection, paths, workers, args.chunk_size, args.dsn
+                        )
+                        print(f"{workers:<14}{seconds:>9.2f}s{args.count / seconds:>14,.0f}")
+            finally:
+                connection.rollback()
+                connection.execute(
+                    SQL("DROP SCHEMA IF EXISTS {} CASCADE").format(Identifier(SCHEMA))
+                )
+                connection.commit()
+
+
+if __name__ == "__main__":
+    main()
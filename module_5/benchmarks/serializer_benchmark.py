@@ -0,0 +1,105 @@
+"""
+Module: serializer_benchmark.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+
+Description:
+    Compares the json, orjson and msgspec serializers on a generated applicant data file:
+    encoding it, and decoding it through iter_json_data as both a JSON array and JSON Lines.
+
+Usage (from module_5):
+    python -m benchmarks.serializer_benchmark [--count N]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Any
+
+from src.utils.serializers import available_serializers, get_serializer
+from src.website.load_data import iter_json_data
+
+TERMS = ["Fall 2025", "Spring 2025", "Fall 2024", ""]
+STATUSES = ["Accepted", "Rejected", "Wait", "Interview"]
+DEGREES = ["Masters", "PhD"]
+
+
+def generate_records(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Build cleaned applicant records shaped like module_2's output.
+
+    Args:
+        count (int): Number of records.
+        seed (int): Random seed, for repeatable runs.
+
+    Returns:
+        list[dict[str, Any]]: The records.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "url": f"https://www.thegradcafe.com/result/{n}",
+            "university": rng.choice(["Johns Hopkins University", "MIT", "Stanford University"]),
+            "program_name": rng.choice(["Computer Science", "Physics", "Economics"]),
+            "date_added": "2025-03-03",
+            "term": rng.choice(TERMS),
+            "status": rng.choice(STATUSES),
+            "decision_date": rng.choice([None, "2025-03-01"]),
+            "comments": rng.choice(["", "Got the email this morning!", "Très content — funded"]),
+            "us_international": rng.choice(["American", "International", ""]),
+            "gre_score": str(rng.randint(290, 340)),
+            "gre_v_score": str(rng.randint(140, 170)),
+            "gre_q_score": str(rng.randint(140, 170)),
+            "gre_aw_score": f"{rng.randint(2, 6)}.{rng.choice([0, 5])}",
+            "degree": rng.choice(DEGREES),
+            "gpa": f"{rng.uniform(2.5, 4.0):.2f}",
+        }
+        for n in range(count)
+    ]
+
+
+def _seconds(function: Any) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _read_all(path: str, backend: str) -> int:
+    count = 0
+    for record in iter_json_data(path, serializer=backend):
+        record.get("url")
+        count += 1
+    return count
+
+
+def main() -> None:
+    """Time each installed serializer on the same records."""
+    parser = argparse.ArgumentParser(description="Compare JSON serializer backends.")
+    parser.add_argument("--count", type=int, default=500_000, help="number of records")
+    args = parser.parse_args()
+
+    records = generate_records(args.count)
+    reference = get_serializer("json")
+
+    with tempfile.TemporaryDirectory() as directory:
+        array_path = os.path.join(directory, "applicant_data.json")
+        lines_path = os.path.join(directory, "applicant_data.jsonl")
+        with open(array_path, "wb") as f:
+            f.write(reference.dumps(records))
+        with open(lines_path, "wb") as f:
+            f.writelines(reference.dumps(record) + b"\n" for record in records)
+
+        print(f"{args.count:,} records, {os.path.getsize(array_path) / 1e6:.0f} MB as JSON")
+        print(f"{'backend':<10}{'encode':>10}{'load .json':>13}{'load .jsonl':>14}")
+        for backend in available_serializers()[::-1]:
+            serializer = get_serializer(backend)
+            encode = _seconds(lambda serializer=serializer: serializer.dumps(records))
+            load_array = _seconds(lambda backend=backend: _read_all(array_path, backend))
+            load_lines = _seconds(lambda backend=backend: _read_all(lines_path, backend))
+            print(f"{backend:<10}{encode:>9.2f}s{load_array:>12.2f}s{load_lines:>13.2f}s")
+
+
+if __name__ == "__main__":
+    main()
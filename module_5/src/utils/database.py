@@ -2,18 +2,22 @@
 Module: database.py
 Author: Billy Presume
 Created: 2025-06-04
-Modified: 2025-06-17
+Modified: 2026-10-18
 
 Description:
-    Provides a secure PostgreSQL connection using psycopg v3.
+    Provides a secure PostgreSQL connection using psycopg v3, and the application-wide
+    connection pool the Flask app borrows its connections from.
 """
 
+import atexit
 import os
 import logging
 from typing import Optional
 
 from psycopg import connect, Connection
+from psycopg.conninfo import make_conninfo
 from psycopg.errors import OperationalError
+from psycopg_pool import ConnectionPool
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -23,6 +27,15 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+class _PoolHolder:
+    """Holds the application-wide connection pool, created by init_pool."""
+
+    pool: Optional[ConnectionPool] = None
+
+
+_holder = _PoolHolder()
+
+
 def connect_to_database() -> Optional[Connection]:
     """
     Establishes a secure connection to a PostgreSQL database using environment variables.
@@ -64,3 +77,94 @@ def connect_to_database() -> Optional[Connection]:
         logger.exception("Unexpected error while connecting to the database: %s", e)
 
     return None
+
+
+def database_conninfo() -> str:
+    """
+    Builds a libpq connection string from the same environment variables as connect_to_database.
+
+    Returns:
+        str: Connection string.
+
+    Raises:
+        EnvironmentError: If DB_NAME, DB_USER or DB_PASSWORD is missing.
+    """
+    dbname = os.getenv("DB_NAME")
+    user = os.getenv("DB_USER")
+    password = os.getenv("DB_PASSWORD")
+    if not all([dbname, user, password]):
+        raise EnvironmentError("Missing required database credentials in .env")
+
+    return make_conninfo(
+        dbname=dbname,
+        user=user,
+        password=password,
+        host=os.getenv("DB_HOST", "localhost"),
+        port=os.getenv("DB_PORT", "5432"),
+    )
+
+
+def init_pool(
+    conninfo: Optional[str] = None,
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> ConnectionPool:
+    """
+    Creates the application-wide connection pool, or returns it if it already exists.
+
+    The pool opens its connections in the background, so the app starts even while the
+    database is unreachable. Every connection is checked before it is handed out and replaced
+    if the server dropped it. The pool is closed when the process exits.
+
+    Args:
+        conninfo (Optional[str]): libpq connection string. Defaults to database_conninfo().
+        min_size (Optional[int]): Connections kept open. Defaults to DB_POOL_MIN_SIZE, then 1.
+        max_size (Optional[int]): Most connections open at once. Defaults to DB_POOL_MAX_SIZE,
+            then 10.
+
+    Returns:
+        ConnectionPool: The application-wide pool.
+
+    Environment Variables Optional:
+        - DB_POOL_MIN_SIZE: Connections kept open (default: 1)
+        - DB_POOL_MAX_SIZE: Most connections open at once (default: 10)
+        - DB_POOL_TIMEOUT: Seconds to wait for a free connection (default: 30)
+    """
+    if _holder.pool is not None:
+        return _holder.pool
+
+    min_size = min_size if min_size is not None else int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+    max_size = max_size if max_size is not None else int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    pool = ConnectionPool(
+        conninfo or database_conninfo(),
+        min_size=min_size,
+        max_size=max(min_size, max_size),
+        timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        check=ConnectionPool.check_connection,
+        name="applicants",
+        open=False,
+    )
+    pool.open(wait=False)
+    _holder.pool = pool
+    atexit.register(close_pool)
+    logger.info(
+        "Opened database connection pool (%d-%d connections).", pool.min_size, pool.max_size
+    )
+    return pool
+
+
+def get_pool() -> Optional[ConnectionPool]:
+    """
+    Returns the application-wide connection pool.
+
+    Returns:
+        Optional[ConnectionPool]: The pool, or None if init_pool has not been called.
+    """
+    return _holder.pool
+
+
+def close_pool() -> None:
+    """Closes the application-wide connection pool and all of its connections."""
+    pool, _holder.pool = _holder.pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,358 @@
+"""
+Module: query_cache.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+
+Description:
+    Result cache for the analytics queries. Keys are built by the caller; the homepage
+    (routes.safe_fetch_named_query) uses the registered query name and its sorted parameters,
+    f"{name}:{sorted(params.items())!r}".
+
+    Entries expire after a time to live and the least recently used ones are evicted once the
+    cache is full. Backends:
+        - memory: a dictionary in the process, the fastest; each process has its own.
+        - sqlite: a local SQLite file shared by every process of the app (e.g. several web
+          server workers), so a load in one process invalidates the cache for all of them.
+        - none: caching disabled.
+
+    The backend and its limits are read from the environment:
+        - QUERY_CACHE_BACKEND: memory, sqlite or none (default: memory)
+        - QUERY_CACHE_TTL: Seconds an entry stays valid (default: 300)
+        - QUERY_CACHE_MAX_ENTRIES: Most entries kept (default: 256)
+        - QUERY_CACHE_PATH: SQLite file (default: query_cache.sqlite3 in the Flask instance
+          folder, DEFAULT_CACHE_DIR)
+
+    The SQLite file is created readable and writable by its owner only, and holds rows as JSON
+    with tagged Decimal and date values, never as pickles, so a planted file cannot run code.
+
+    The data only changes when applicants are loaded, so the loaders call
+    invalidate_query_cache() once their transaction is committed.
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+QUERY_CACHE_BACKENDS = ("memory", "sqlite", "none")
+
+# Flask's instance folder of the app (src.website): module_5/instance. The web app and the
+# loaders run from the same tree, so they find the same SQLite file.
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "instance"
+)
+
+Rows = list[tuple[Any, ...]]
+
+
+class QueryCache(ABC):
+    """Interface of the query cache backends."""
+
+    name = ""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Rows]:
+        """Return the cached rows of a query.
+
+        Args:
+            key (str): Query name and parameters, as built by the caller.
+
+        Returns:
+            Optional[Rows]: The rows, or None if they are not cached or have expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, rows: Rows) -> None:
+        """Cache the rows of a query.
+
+        Args:
+            key (str): Query name and parameters, as built by the caller.
+            rows (Rows): Rows returned by the query.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class MemoryQueryCache(QueryCache):
+    """In-process TTL and LRU cache, safe to share between request threads."""
+
+    name = "memory"
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl (float): Seconds an entry stays valid.
+            max_entries (int): Most entries kept; the least recently used are evicted first.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Rows]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Rows]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, rows: Rows) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class NullQueryCache(QueryCache):
+    """Cache that keeps nothing, for running every query against the database."""
+
+    name = "none"
+
+    def get(self, key: str) -> Optional[Rows]:
+        return None
+
+    def set(self, key: str, rows: Rows) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+def _encode_value(value: Any) -> dict[str, str]:
+    # JSON has no Decimal or date; NUMERIC results must come back as Decimal to render the same
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Cannot cache a value of type {type(value).__name__}")
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    if "__decimal__" in obj:
+        return Decimal(obj["__decimal__"])
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    if "__date__" in obj:
+        return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+def dumps_rows(rows: Rows) -> str:
+    """Encode query rows as JSON, keeping Decimal, date and datetime values.
+
+    Args:
+        rows (Rows): Rows returned by a query.
+
+    Returns:
+        str: The JSON text.
+
+    Raises:
+        TypeError: If a value is of a type that cannot be encoded.
+    """
+    return json.dumps(rows, default=_encode_value)
+
+
+def loads_rows(text: str) -> Rows:
+    """Decode query rows encoded by dumps_rows.
+
+    Args:
+        text (str): The JSON text.
+
+    Returns:
+        Rows: The rows, as tuples.
+
+    Raises:
+        ValueError: If the text is not JSON rows.
+    """
+    rows = json.loads(text, object_hook=_decode_value)
+    if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+        raise ValueError("Expected a list of rows.")
+    return [tuple(row) for row in rows]
+
+
+class SQLiteQueryCache(QueryCache):
+    """TTL and LRU cache in a local SQLite file shared by every process that opens it."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, ttl: float = 300.0, max_entries: int = 256) -> None:
+        """Initialize the cache, creating the file and its table if needed.
+
+        Args:
+            path (str): SQLite database file.
+            ttl (float): Seconds an entry stays valid.
+            max_entries (int): Most entries kept; the least recently used are evicted first.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Create the file for its owner only before SQLite opens it; its WAL files inherit this
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(path, 0o600)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS query_cache (
+                    key TEXT PRIMARY KEY,
+                    rows TEXT NOT NULL,
+                    expires REAL NOT NULL,
+                    used REAL NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per call: cheap for a local file, and safe across threads and forks
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def get(self, key: str) -> Optional[Rows]:
+        # Wall-clock time, since entries are shared with other processes
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT rows, expires FROM query_cache WHERE key = ?", (key, )
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                connection.execute("DELETE FROM query_cache WHERE key = ?", (key, ))
+                return None
+            try:
+                rows = loads_rows(row[0])
+            except (TypeError, ValueError) as err:
+                # e.g. an entry written in an older format; drop it and query again
+                logger.warning("Dropping unreadable query cache entry: %s", err)
+                connection.execute("DELETE FROM query_cache WHERE key = ?", (key, ))
+                return None
+            connection.execute("UPDATE query_cache SET used = ? WHERE key = ?", (now, key))
+        return rows
+
+    def set(self, key: str, rows: Rows) -> None:
+        try:
+            text = dumps_rows(rows)
+        except (TypeError, ValueError) as err:
+            logger.warning("Not caching query rows: %s", err)
+            return
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO query_cache (key, rows, expires, used) VALUES (?, ?, ?, ?)",
+                (key, text, now + self.ttl, now),
+            )
+            connection.execute(
+                """
+                DELETE FROM query_cache WHERE key IN (
+                    SELECT key FROM query_cache ORDER BY used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries, ),
+            )
+
+    def clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM query_cache")
+
+
+class _CacheHolder:
+    """Holds the process-wide query cache, created by get_query_cache."""
+
+    cache: Optional[QueryCache] = None
+    lock = threading.Lock()
+
+
+_holder = _CacheHolder()
+
+
+def create_query_cache(
+    backend: Optional[str] = None,
+    ttl: Optional[float] = None,
+    max_entries: Optional[int] = None,
+    path: Optional[str] = None,
+) -> QueryCache:
+    """Create a query cache.
+
+    Args:
+        backend (Optional[str]): "memory", "sqlite" or "none". Defaults to QUERY_CACHE_BACKEND,
+            then "memory".
+        ttl (Optional[float]): Seconds an entry stays valid. Defaults to QUERY_CACHE_TTL, then 300.
+        max_entries (Optional[int]): Most entries kept. Defaults to QUERY_CACHE_MAX_ENTRIES,
+            then 256.
+        path (Optional[str]): SQLite file of the "sqlite" backend. Defaults to QUERY_CACHE_PATH,
+            then query_cache.sqlite3 in DEFAULT_CACHE_DIR.
+
+    Returns:
+        QueryCache: The cache.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    backend = backend or os.getenv("QUERY_CACHE_BACKEND") or "memory"
+    if backend not in QUERY_CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown query cache backend: {backend}. Expected one of {QUERY_CACHE_BACKENDS}."
+        )
+    ttl = ttl if ttl is not None else float(os.getenv("QUERY_CACHE_TTL", "300"))
+    if max_entries is None:
+        max_entries = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256"))
+
+    if backend == "memory":
+        return MemoryQueryCache(ttl, max_entries)
+    if backend == "sqlite":
+        path = path or os.getenv("QUERY_CACHE_PATH") or os.path.join(
+            DEFAULT_CACHE_DIR, "query_cache.sqlite3"
+        )
+        return SQLiteQueryCache(path, ttl, max_entries)
+    return NullQueryCache()
+
+
+def get_query_cache() -> QueryCache:
+    """Return the process-wide query cache, creating it from the environment on first use.
+
+    Returns:
+        QueryCache: The shared cache.
+    """
+    with _holder.lock:
+        if _holder.cache is None:
+            _holder.cache = create_query_cache()
+            logger.info("Using '%s' query cache.", _holder.cache.name)
+        return _holder.cache
+
+
+def invalidate_query_cache() -> None:
+    """Drop every cached query result, e.g. after new applicants were committed."""
+    try:
+        get_query_cache().clear()
+        logger.info("Query cache invalidated.")
+    except Exception as e:
+        logger.error("Failed to invalidate the query cache: %s", e)
@@ -2,22 +2,40 @@
 Module: __init__.py
 Author: Billy Presume
 Created: 2025-06-04
-Modified: 2025-06-04
+Modified: 2026-10-18
 Description: Flask application factory and blueprint registration.
 """
 
+import logging
+import multiprocessing
+
 from flask import Flask
+
+from src.utils.database import init_pool
 from .routes import views
 
+logger = logging.getLogger(__name__)
+
 
 def create_app() -> Flask:
     """
     Flask application factory.
 
+    Also creates the database connection pool shared by all requests. If it cannot be created
+    (e.g. missing credentials), queries fall back to opening their own connections. The pool is
+    not created in worker processes started by multiprocessing (the loader's spawn workers
+    import app.py again), since they never serve requests.
+
     Returns:
         Flask: A configured Flask application instance.
     """
     app = Flask(__name__)
 
+    if multiprocessing.parent_process() is None:
+        try:
+            init_pool()
+        except Exception as e:
+            logger.error("Could not create the database connection pool: %s", e)
+
     app.register_blueprint(views)
     return app
@@ -0,0 +1,225 @@
+"""
+Module: dashboard.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+
+Description:
+    SQL behind the homepage analytics.
+
+    The applicant_summary materialized view pre-aggregates the applicants table: one row per
+    term, status, citizenship and JHU CS Masters flag, with its applicant count and the sums
+    and counts of GPA and GRE values. The loaders refresh it after every load, so the
+    homepage reads a few hundred summary rows (DASHBOARD_SUMMARY_QUERY) instead of scanning
+    every applicant (DASHBOARD_QUERY, kept as the fallback while the view does not exist).
+    Both are registered as named queries and run with DASHBOARD_PARAMS.
+"""
+
+import logging
+
+from psycopg import Connection
+from psycopg.sql import SQL, Identifier, Literal, Composed, Placeholder
+
+from src.website.query_data import register_query
+
+logger = logging.getLogger(__name__)
+
+# Values of the dashboard filters. They are sent as parameters of prepared statements rather
+# than written into the SQL, so every page view reuses the same statements and plans.
+DASHBOARD_PARAMS: dict[str, str] = {
+    "term": "Fall 2025",
+    "american": "American",
+    "other": "Other",
+    "accepted": "Accepted",
+    "jhu": "%JHU%",
+    "cs": "%Computer Science%",
+    "master": "%Master%",
+}
+
+_JHU_CS_MASTERS = SQL("university ILIKE {jhu} AND program ILIKE {cs} AND degree ILIKE {master}")
+
+# Row filters of the dashboard metrics, used in FILTER (WHERE ...) clauses of DASHBOARD_QUERY
+# with DASHBOARD_PARAMS. All but jhu_cs_masters only read grouping columns of
+# applicant_summary, so they filter its rows just as well.
+DASHBOARD_FILTERS: dict[str, Composed] = {
+    "fall_2025": SQL("term = {term}").format(term=Placeholder("term")),
+    "international": SQL("us_or_international NOT IN ({amer}, {other})").format(
+        amer=Placeholder("american"), other=Placeholder("other")
+    ),
+    "american_fall_2025": SQL("us_or_international = {amer} AND term = {term}").format(
+        amer=Placeholder("american"), term=Placeholder("term")
+    ),
+    "accepted_fall_2025": SQL("status ILIKE {accepted} AND term = {term}").format(
+        accepted=Placeholder("accepted"), term=Placeholder("term")
+    ),
+    "jhu_cs_masters": _JHU_CS_MASTERS.format(
+        jhu=Placeholder("jhu"), cs=Placeholder("cs"), master=Placeholder("master")
+    ),
+}
+
+# Names of the DASHBOARD_QUERY and DASHBOARD_SUMMARY_QUERY columns, in order
+DASHBOARD_METRICS = (
+    "fall_2025_count",
+    "international_count",
+    "total_count",
+    "avg_gpa",
+    "avg_gre",
+    "avg_gre_v",
+    "avg_gre_aw",
+    "avg_gpa_american_fall_2025",
+    "accepted_fall_2025_count",
+    "avg_gpa_accepted_fall_2025",
+    "jhu_cs_masters_count",
+)
+
+# Every homepage metric in one scan of the table. AVG skips NULLs, so each average only covers
+# the applicants who provided that value.
+DASHBOARD_QUERY = SQL(
+    """
+    SELECT
+        COUNT(*) FILTER (WHERE {fall_2025}),
+        COUNT(*) FILTER (WHERE {international}),
+        COUNT(*),
+        ROUND(AVG(gpa)::NUMERIC, 2),
+        ROUND(AVG(gre)::NUMERIC, 1),
+        ROUND(AVG(gre_v)::NUMERIC, 1),
+        ROUND(AVG(gre_aw)::NUMERIC, 2),
+        ROUND((AVG(gpa) FILTER (WHERE {american_fall_2025}))::NUMERIC, 2),
+        COUNT(*) FILTER (WHERE {accepted_fall_2025}),
+        ROUND((AVG(gpa) FILTER (WHERE {accepted_fall_2025}))::NUMERIC, 2),
+        COUNT(*) FILTER (WHERE {jhu_cs_masters})
+    FROM {table}
+    """
+).format(table=Identifier("applicants"), **DASHBOARD_FILTERS)
+
+SUMMARY_VIEW = Identifier("applicant_summary")
+
+# Sums are NUMERIC so that averaging the groups back together is exact
+CREATE_SUMMARY_QUERY = SQL(
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS {view} AS
+    SELECT
+        term,
+        status,
+        us_or_international,
+        COALESCE({jhu_cs_masters}, FALSE) AS jhu_cs_masters,
+        COUNT(*) AS applicants,
+        SUM(gpa::NUMERIC) AS gpa_sum,
+        COUNT(gpa) AS gpa_count,
+        SUM(gre::NUMERIC) AS gre_sum,
+        COUNT(gre) AS gre_count,
+        SUM(gre_v::NUMERIC) AS gre_v_sum,
+        COUNT(gre_v) AS gre_v_count,
+        SUM(gre_aw::NUMERIC) AS gre_aw_sum,
+        COUNT(gre_aw) AS gre_aw_count
+    FROM {table}
+    GROUP BY 1, 2, 3, 4
+    """
+).format(
+    view=SUMMARY_VIEW,
+    table=Identifier("applicants"),
+    # DDL cannot take parameters, so the view has the values written in
+    jhu_cs_masters=_JHU_CS_MASTERS.format(
+        jhu=Literal(DASHBOARD_PARAMS["jhu"]),
+        cs=Literal(DASHBOARD_PARAMS["cs"]),
+        master=Literal(DASHBOARD_PARAMS["master"]),
+    ),
+)
+
+# REFRESH ... CONCURRENTLY needs a unique index; it lets the homepage keep reading meanwhile
+CREATE_SUMMARY_INDEX_QUERY = SQL(
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS applicant_summary_key
+    ON {view} (term, status, us_or_international, jhu_cs_masters)
+    """
+).format(view=SUMMARY_VIEW)
+
+REFRESH_SUMMARY_QUERY = SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {view}").format(
+    view=SUMMARY_VIEW
+)
+
+# The DASHBOARD_QUERY metrics, added up from the summary groups
+DASHBOARD_SUMMARY_QUERY = SQL(
+    """
+    SELECT
+        (SUM(applicants) FILTER (WHERE {fall_2025}))::BIGINT,
+        (SUM(applicants) FILTER (WHERE {international}))::BIGINT,
+        SUM(applicants)::BIGINT,
+        ROUND(SUM(gpa_sum) / NULLIF(SUM(gpa_count), 0), 2),
+        ROUND(SUM(gre_sum) / NULLIF(SUM(gre_count), 0), 1),
+        ROUND(SUM(gre_v_sum) / NULLIF(SUM(gre_v_count), 0), 1),
+        ROUND(SUM(gre_aw_sum) / NULLIF(SUM(gre_aw_count), 0), 2),
+        ROUND(
+            SUM(gpa_sum) FILTER (WHERE {american_fall_2025})
+            / NULLIF(SUM(gpa_count) FILTER (WHERE {american_fall_2025}), 0), 2
+        ),
+        (SUM(applicants) FILTER (WHERE {accepted_fall_2025}))::BIGINT,
+        ROUND(
+            SUM(gpa_sum) FILTER (WHERE {accepted_fall_2025})
+            / NULLIF(SUM(gpa_count) FILTER (WHERE {accepted_fall_2025}), 0), 2
+        ),
+        (SUM(applicants) FILTER (WHERE jhu_cs_masters))::BIGINT
+    FROM {view}
+    """
+).format(
+    view=SUMMARY_VIEW,
+    fall_2025=DASHBOARD_FILTERS["fall_2025"],
+    international=DASHBOARD_FILTERS["international"],
+    american_fall_2025=DASHBOARD_FILTERS["american_fall_2025"],
+    accepted_fall_2025=DASHBOARD_FILTERS["accepted_fall_2025"],
+)
+
+# Whether applicant_summary exists yet, so the homepage can skip DASHBOARD_SUMMARY_QUERY (and
+# the error it would raise) until the first load has created the view
+SUMMARY_EXISTS_QUERY = SQL("SELECT to_regclass('applicant_summary') IS NOT NULL")
+
+# Names the dashboard queries are registered under, to run with execute_named_query
+DASHBOARD_QUERY_NAME = "dashboard"
+DASHBOARD_SUMMARY_QUERY_NAME = "dashboard_summary"
+SUMMARY_EXISTS_QUERY_NAME = "dashboard_summary_exists"
+register_query(DASHBOARD_QUERY_NAME, DASHBOARD_QUERY)
+register_query(DASHBOARD_SUMMARY_QUERY_NAME, DASHBOARD_SUMMARY_QUERY)
+register_query(SUMMARY_EXISTS_QUERY_NAME, SUMMARY_EXISTS_QUERY)
+
+
+def create_applicant_summary(connection: Connection) -> bool:
+    """
+    Creates and populates the applicant_summary materialized view if it does not exist.
+
+    Args:
+        connection (Connection): psycopg3 database connection; the applicants table must exist.
+
+    Returns:
+        bool: True if the view was created (and so is already up to date).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(SQL("SELECT to_regclass('applicant_summary')"))
+        if cursor.fetchone()[0] is not None:  # type: ignore
+            return False
+        cursor.execute(CREATE_SUMMARY_QUERY)
+        cursor.execute(CREATE_SUMMARY_INDEX_QUERY)
+    connection.commit()
+    logger.info("Created 'applicant_summary' materialized view.")
+    return True
+
+
+def refresh_applicant_summary(connection: Connection) -> None:
+    """
+    Recomputes the applicant_summary materialized view from the applicants table.
+
+    The view is created on first use, and afterwards refreshed concurrently so homepage queries
+    are not blocked while it runs. Failures are logged rather than raised: the loaded data is
+    already committed, and the homepage falls back to DASHBOARD_QUERY when the view is missing.
+
+    Args:
+        connection (Connection): psycopg3 database connection.
+    """
+    try:
+        if not create_applicant_summary(connection):
+            with connection.cursor() as cursor:
+                cursor.execute(REFRESH_SUMMARY_QUERY)
+            connection.commit()
+            logger.info("Refreshed 'applicant_summary' materialized view.")
+    except Exception as err:
+        connection.rollback()
+        logger.error("Failed to refresh 'applicant_summary': %s", err)
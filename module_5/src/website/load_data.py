@@ -2,21 +2,36 @@
 Module: load_data.py
 Author: Billy Presume
 Created: 2025-06-04
-Modified: 2025-06-17
+Modified: 2026-10-18
 
 Description:
     Loads data from a JSON file into the PostgreSQL 'applicants' table securely using psycopg3.
+    JSON Lines files (.jsonl/.ndjson, one record per line) are streamed, so inserting starts
+    before the file is fully read and memory use does not depend on the file size.
+    load_applicant_files loads many files at once, one worker process and connection per file.
+    Records are converted to typed column values a chunk at a time by applicant_columns.
+    Once a load has committed changes, the applicant_summary view behind the homepage is
+    refreshed and cached analytics (src.utils.query_cache) are invalidated.
 """
 
 import os
-import json
 import logging
-from datetime import datetime
-from typing import TypedDict, Optional, cast
-
-from psycopg import Connection
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from multiprocessing import get_context
+from typing import Iterable, Iterator, Sequence, TypedDict, Optional, cast
+
+from psycopg import Connection, connect
+from psycopg.errors import DeadlockDetected
 from psycopg.sql import SQL, Identifier, Placeholder
 
+from src.utils.database import connect_to_database
+from src.utils.query_cache import invalidate_query_cache
+from src.website.dashboard import refresh_applicant_summary
+from src.utils.serializers import get_serializer
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
@@ -24,6 +39,8 @@ DATA_FILE = os.path.join(
     os.path.dirname(__file__), 'static', 'gradcafe_applicant_data', 'applicant_data.json'
 )
 
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+
 
 class ApplicantRecord(TypedDict, total=False):
     """Represents the expected structure of each JSON record."""
@@ -35,23 +52,60 @@ class ApplicantRecord(TypedDict, total=False):
     decision_date: Optional[str]
     comments: Optional[str]
     us_international: Optional[str]
-    gre_score: Optional[str]
-    gre_v_score: Optional[str]
-    gre_aw_score: Optional[str]
+    gre_score: Optional[str | float]
+    gre_v_score: Optional[str | float]
+    gre_q_score: Optional[str | float]
+    gre_aw_score: Optional[str | float]
     degree: Optional[str]
-    gpa: Optional[str]
+    gpa: Optional[str | float]
     url: Optional[str]
-    gre: Optional[str]
-    gre_v: Optional[str]
-    gre_aw: Optional[str]
+    gre: Optional[str | float]
+    gre_v: Optional[str | float]
+    gre_aw: Optional[str | float]
     us_or_international: Optional[str]
 
 
+def iter_json_data(
+    file_path: str, serializer: Optional[str] = None
+) -> Iterator[ApplicantRecord]:
+    """Yield applicant records from a JSON or JSON Lines file one at a time.
+
+    JSON Lines files (.jsonl/.ndjson) are read line by line and never held in memory whole.
+    JSON array files have to be parsed completely before the first record is yielded. With the
+    msgspec serializer, records are ApplicantStruct objects, read with the same .get calls.
+
+    Args:
+        file_path (str): Path to the JSON or JSON Lines file.
+        serializer (Optional[str]): JSON backend; see src.utils.serializers.get_serializer.
+
+    Yields:
+        ApplicantRecord: Each applicant record, in file order.
+
+    Raises:
+        FileNotFoundError: If file not found.
+        json.JSONDecodeError: If JSON (or a JSON line) is malformed.
+        ValueError: If top-level object is not a list of objects, a line is not an object, or
+            (msgspec only) a field has the wrong type.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    backend = get_serializer(serializer)
+    with open(file_path, 'rb') as f:
+        if not file_path.lower().endswith(JSON_LINES_EXTENSIONS):
+            yield from cast(list[ApplicantRecord], backend.load_records(f.read()))
+            return
+
+        for line in f:
+            if line.strip():
+                yield cast(ApplicantRecord, backend.load_record(line))
+
+
 def load_json_data(file_path: str) -> list[ApplicantRecord]:
     """Load and validate JSON data from a file.
 
     Args:
-        file_path (str): Path to the JSON file.
+        file_path (str): Path to the JSON or JSON Lines file.
 
     Returns:
         list[ApplicantRecord]: List of valid applicant records.
@@ -61,33 +115,39 @@ def load_json_data(file_path: str) -> list[ApplicantRecord]:
         json.JSONDecodeError: If JSON is malformed.
         ValueError: If top-level object is not a list.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    data = list(iter_json_data(file_path))
+    logger.info("Loaded %d records from JSON.", len(data))
+    return data
 
-    with open(file_path, encoding='utf-8') as f:
-        data = json.load(f)
 
-    if not isinstance(data, list):
-        raise ValueError("Expected top-level JSON to be a list.")
+@lru_cache(maxsize=1024)
+def _to_float(value: Optional[str | float]) -> Optional[float]:
+    """Cached float conversion; GRE scores and GPAs repeat a few hundred distinct values."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
 
-    data = cast(list[ApplicantRecord], data)
-    logger.info("Loaded %d records from JSON.", len(data))
-    return data
+
+@lru_cache(maxsize=4096)
+def _to_date(value: Optional[str]) -> Optional[date]:
+    """Cached date conversion; entries share a few hundred distinct date strings."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+    except ValueError:
+        return None
 
 
-def parse_float(value: Optional[str]) -> Optional[float]:
+def parse_float(value: Optional[str | float]) -> Optional[float]:
     """Parse float safely from string.
 
     Args:
-        value (Optional[str]): Input string.
+        value (Optional[str | float]): Input string, or a number as written by other tools.
 
     Returns:
         Optional[float]: Parsed float or None.
     """
-    try:
-        return float(value) if value is not None else None
-    except ValueError:
-        return None
+    return _to_float(value)
 
 
 def parse_date(value: Optional[str]) -> Optional[str]:
@@ -99,15 +159,20 @@ def parse_date(value: Optional[str]) -> Optional[str]:
     Returns:
         Optional[str]: ISO-formatted date or None.
     """
-    try:
-        return datetime.strptime(value, "%Y-%m-%d").date().isoformat() if value else None
-    except ValueError:
-        return None
+    parsed = _to_date(value)
+    return parsed.isoformat() if parsed else None
 
 
 def create_applicants_table(connection: Connection) -> None:
     """Create the applicants table if it does not already exist.
 
+    The GradCafe URL identifies an entry, so it gets a unique index that loads upsert against.
+    A table created before the index existed may hold duplicate URLs; they are removed first,
+    keeping the most recently inserted copy of each entry.
+
+    No other index is created: the homepage reads the applicant_summary view, and refreshing
+    it scans the whole table anyway.
+
     Args:
         connection (Connection): psycopg3 database connection.
     """
@@ -135,10 +200,144 @@ def create_applicants_table(connection: Connection) -> None:
 
     with connection.cursor() as cursor:
         cursor.execute(query)
+        cursor.execute(SQL("SELECT to_regclass('applicants_url_key')"))
+        if cursor.fetchone()[0] is None:  # type: ignore
+            cursor.execute(
+                SQL(
+                    """
+                    DELETE FROM applicants a USING applicants b
+                    WHERE a.url = b.url AND a.p_id < b.p_id
+                """
+                )
+            )
+            if cursor.rowcount:
+                logger.info("Removed %d duplicate applicants by URL.", cursor.rowcount)
+            cursor.execute(
+                SQL("CREATE UNIQUE INDEX IF NOT EXISTS applicants_url_key ON applicants (url)")
+            )
         connection.commit()
         logger.info("Created or verified 'applicants' table.")
 
 
+APPLICANT_COLUMNS = (
+    "university", "program", "date_added", "term", "status", "decision_date", "comments",
+    "us_or_international", "gpa", "gre", "gre_v", "gre_aw", "degree", "url"
+)
+
+_UPDATED_COLUMNS = [column for column in APPLICANT_COLUMNS if column != "url"]
+
+# An entry already loaded under the same URL is updated in place, and only if it changed
+UPSERT_CLAUSE = SQL(
+    "ON CONFLICT (url) DO UPDATE SET {assignments} WHERE ({current}) IS DISTINCT FROM ({new})"
+).format(
+    assignments=SQL(", ").join(
+        SQL("{0} = EXCLUDED.{0}").format(Identifier(column)) for column in _UPDATED_COLUMNS
+    ),
+    current=SQL(", ").join(Identifier("applicants", column) for column in _UPDATED_COLUMNS),
+    new=SQL(", ").join(Identifier("excluded", column) for column in _UPDATED_COLUMNS),
+)
+
+_COLUMN_LIST = SQL(", ").join(Identifier(column) for column in APPLICANT_COLUMNS)
+
+# Values are passed positionally, as tuples in APPLICANT_COLUMNS order
+INSERT_APPLICANT_QUERY = SQL("INSERT INTO {table} ({columns}) VALUES ({values}) {upsert}").format(
+    table=Identifier("applicants"),
+    columns=_COLUMN_LIST,
+    values=SQL(", ").join(Placeholder() for _ in APPLICANT_COLUMNS),
+    upsert=UPSERT_CLAUSE,
+)
+
+# COPY cannot upsert, so chunks are copied into a staging table and merged from there. seq is
+# the record number in the file: the last copy of a URL wins.
+CREATE_STAGING_QUERY = SQL(
+    """
+    CREATE TEMP TABLE IF NOT EXISTS applicants_staging ON COMMIT DROP AS
+    SELECT 0::BIGINT AS seq, {columns} FROM applicants WITH NO DATA
+"""
+).format(columns=_COLUMN_LIST)
+
+COPY_APPLICANTS_QUERY = SQL("COPY applicants_staging (seq, {columns}) FROM STDIN").format(
+    columns=_COLUMN_LIST
+)
+
+MERGE_STAGING_QUERY = SQL(
+    """
+    INSERT INTO applicants ({columns})
+    SELECT {columns} FROM (
+        SELECT DISTINCT ON (url, CASE WHEN url IS NULL THEN seq END) *
+        FROM applicants_staging
+        ORDER BY url, CASE WHEN url IS NULL THEN seq END, seq DESC
+    ) latest
+    ORDER BY url, seq
+    {upsert}
+"""
+).format(columns=_COLUMN_LIST, upsert=UPSERT_CLAUSE)
+
+LOAD_METHODS = ("copy", "executemany", "insert")
+
+# Times a file is loaded again after its transaction was chosen as a deadlock victim
+DEADLOCK_RETRIES = 3
+
+
+ApplicantValue = str | float | date | None
+
+
+def _float_column(
+    records: Sequence[ApplicantRecord], key: str, fallback: Optional[str] = None
+) -> list[Optional[float]]:
+    if fallback is None:
+        return [_to_float(record.get(key)) for record in records]
+    return [_to_float(record.get(key)) or _to_float(record.get(fallback)) for record in records]
+
+
+def applicant_columns(records: Sequence[ApplicantRecord]) -> dict[str, list[ApplicantValue]]:
+    """Convert a batch of JSON records into typed column values of the applicants table.
+
+    Each column is built in one pass over the batch. Scores and GPA become floats and dates
+    become datetime.date objects, both through caches shared by the whole load; values that
+    cannot be converted become None. A field that has an older alternative name (gre_score or
+    gre, us_international or us_or_international) falls back to it when missing, empty or zero.
+
+    Args:
+        records (Sequence[ApplicantRecord]): Parsed applicant entries.
+
+    Returns:
+        dict[str, list[ApplicantValue]]: One list per column, keyed and ordered by
+        APPLICANT_COLUMNS, holding the records' values in order.
+    """
+    return {
+        "university": [record.get("university") for record in records],
+        "program": [record.get("program_name") for record in records],
+        "date_added": [_to_date(record.get("date_added")) for record in records],
+        "term": [record.get("term") for record in records],
+        "status": [record.get("status") for record in records],
+        "decision_date": [_to_date(record.get("decision_date")) for record in records],
+        "comments": [record.get("comments") for record in records],
+        "us_or_international": [
+            record.get("us_international") or record.get("us_or_international")
+            for record in records
+        ],
+        "gpa": _float_column(records, "gpa"),
+        "gre": _float_column(records, "gre_score", "gre"),
+        "gre_v": _float_column(records, "gre_v_score", "gre_v"),
+        "gre_aw": _float_column(records, "gre_aw_score", "gre_aw"),
+        "degree": [record.get("degree") for record in records],
+        "url": [record.get("url") for record in records],
+    }
+
+
+def applicant_values(record: ApplicantRecord) -> dict[str, ApplicantValue]:
+    """Convert a JSON record into the column values of the applicants table.
+
+    Args:
+        record (ApplicantRecord): One parsed applicant entry.
+
+    Returns:
+        dict[str, ApplicantValue]: Values keyed by column name, in APPLICANT_COLUMNS order.
+    """
+    return {column: values[0] for column, values in applicant_columns([record]).items()}
+
+
 def insert_applicant(connection: Connection, record: ApplicantRecord) -> None:
     """Insert a single applicant into the applicants table.
 
@@ -146,76 +345,381 @@ def insert_applicant(connection: Connection, record: ApplicantRecord) -> None:
         connection (Connection): psycopg3 database connection.
         record (ApplicantRecord): One parsed applicant entry.
     """
-    query = SQL(
-        """
-        INSERT INTO {table} (
-            university, program, date_added, term, status, decision_date,
-            comments, us_or_international, gpa, gre, gre_v, gre_aw, degree, url
-        ) VALUES (
-            {university}, {program}, {date_added}, {term}, {status}, {decision_date},
-            {comments}, {us_or_international}, {gpa}, {gre}, {gre_v}, {gre_aw}, {degree}, {url}
-        )
+    with connection.cursor() as cursor:
+        cursor.execute(INSERT_APPLICANT_QUERY, tuple(applicant_values(record).values()))
+
+
+def _convert_chunk(
+    numbers: list[int], records: list[ApplicantRecord]
+) -> tuple[list[int], list[tuple[ApplicantValue, ...]]]:
+    """Convert a chunk into rows, dropping (and reporting) the records that cannot be converted.
+
+    Args:
+        numbers (list[int]): Record numbers in the file.
+        records (list[ApplicantRecord]): The records.
+
+    Returns:
+        tuple[list[int], list[tuple]]: Numbers and value rows of the converted records.
     """
-    ).format(
-        table=Identifier("applicants"),
-        university=Placeholder("university"),
-        program=Placeholder("program"),
-        date_added=Placeholder("date_added"),
-        term=Placeholder("term"),
-        status=Placeholder("status"),
-        decision_date=Placeholder("decision_date"),
-        comments=Placeholder("comments"),
-        us_or_international=Placeholder("us_or_international"),
-        gpa=Placeholder("gpa"),
-        gre=Placeholder("gre"),
-        gre_v=Placeholder("gre_v"),
-        gre_aw=Placeholder("gre_aw"),
-        degree=Placeholder("degree"),
-        url=Placeholder("url")
-    )
+    try:
+        return numbers, list(zip(*applicant_columns(records).values()))
+    except Exception:
+        # A malformed record fails the whole batch; convert one by one to find it
+        kept_numbers: list[int] = []
+        rows: list[tuple[ApplicantValue, ...]] = []
+        for number, record in zip(numbers, records):
+            try:
+                rows.append(tuple(applicant_values(record).values()))
+                kept_numbers.append(number)
+            except Exception as err:
+                logger.error("Failed to insert record #%d: %s", number, err)
+        return kept_numbers, rows
 
-    values: dict[str, str | float | None] = {
-        "university": record.get("university"),
-        "program": record.get("program_name"),
-        "date_added": parse_date(record.get("date_added")),
-        "term": record.get("term"),
-        "status": record.get("status"),
-        "decision_date": parse_date(record.get("decision_date")),
-        "comments": record.get("comments"),
-        "us_or_international": record.get("us_international") or record.get("us_or_international"),
-        "gpa": parse_float(record.get("gpa")),
-        "gre": parse_float(record.get("gre_score")) or parse_float(record.get("gre")),
-        "gre_v": parse_float(record.get("gre_v_score")) or parse_float(record.get("gre_v")),
-        "gre_aw": parse_float(record.get("gre_aw_score")) or parse_float(record.get("gre_aw")),
-        "degree": record.get("degree"),
-        "url": record.get("url"),
-    }
 
+def _insert_rows_individually(
+    connection: Connection, numbers: list[int], rows: list[tuple[ApplicantValue, ...]]
+) -> int:
+    """Upsert rows one by one, each under its own savepoint, skipping the ones that fail.
+
+    Args:
+        connection (Connection): psycopg3 database connection.
+        numbers (list[int]): Record numbers of the rows.
+        rows (list[tuple]): Column values of each row, in APPLICANT_COLUMNS order.
+
+    Returns:
+        int: Number of rows inserted or changed.
+    """
+    inserted = 0
+    # Render the composed statement once instead of re-quoting its identifiers for every row
+    query = INSERT_APPLICANT_QUERY.as_bytes(connection)
     with connection.cursor() as cursor:
-        cursor.execute(query, values)
+        for number, row in zip(numbers, rows):
+            try:
+                with connection.transaction():
+                    cursor.execute(query, row)
+                inserted += cursor.rowcount
+            except DeadlockDetected:
+                raise
+            except Exception as err:
+                logger.error("Failed to insert record #%d: %s", number, err)
+    return inserted
 
 
-def load_applicants(connection: Connection, json_path: str = DATA_FILE) -> None:
-    """Load all applicants from the JSON file into the database.
+def _copy_rows(
+    connection: Connection, numbers: list[int], rows: list[tuple[ApplicantValue, ...]]
+) -> int:
+    """COPY a chunk of rows into the staging table and merge it into the applicants table.
+
+    The chunk is copied and merged under a savepoint. If the server rejects it, the savepoint is
+    rolled back and the chunk is upserted row by row instead, so only the bad rows are lost and
+    each one is reported. A deadlock is raised instead, for _load_file to retry the whole file.
 
     Args:
         connection (Connection): psycopg3 database connection.
-        json_path (str): Path to the JSON file.
+        numbers (list[int]): Record numbers of the rows.
+        rows (list[tuple]): Column values of each row, in APPLICANT_COLUMNS order.
+
+    Returns:
+        int: Number of rows inserted or changed.
     """
     try:
-        create_applicants_table(connection)
-        applicants = load_json_data(json_path)
+        with connection.transaction():
+            with connection.cursor() as cursor:
+                cursor.execute(CREATE_STAGING_QUERY)
+                with cursor.copy(COPY_APPLICANTS_QUERY) as copy:
+                    for number, row in zip(numbers, rows):
+                        copy.write_row((number, *row))
+                cursor.execute(MERGE_STAGING_QUERY)
+                merged = cursor.rowcount
+                cursor.execute(SQL("TRUNCATE applicants_staging"))
+        return merged
+    except DeadlockDetected:
+        raise
+    except Exception as err:
+        logger.warning(
+            "COPY of records #%d-#%d failed (%s); retrying them one by one.",
+            numbers[0], numbers[-1], err
+        )
+        return _insert_rows_individually(connection, numbers, rows)
 
-        for idx, record in enumerate(applicants, start=1):
-            try:
-                insert_applicant(connection, record)
-            except Exception as err:
-                logger.error("Failed to insert record #%d: %s", idx, err)
 
-        connection.commit()
-        logger.info("Inserted %d records into 'applicants' table.", len(applicants))
+def _executemany_rows(
+    connection: Connection, numbers: list[int], rows: list[tuple[ApplicantValue, ...]]
+) -> int:
+    """Insert a batch of rows with executemany in pipeline mode.
+
+    The INSERT is sent for every row of the batch without waiting for each result, and psycopg
+    prepares it on the server after the first few executions. The batch runs under a savepoint;
+    if any row fails, the batch is rolled back and retried row by row so only the bad rows are
+    lost and each one is reported. A deadlock is raised instead, for _load_file to retry the
+    whole file.
+
+    Args:
+        connection (Connection): psycopg3 database connection.
+        numbers (list[int]): Record numbers of the rows.
+        rows (list[tuple]): Column values of each row, in APPLICANT_COLUMNS order.
+
+    Returns:
+        int: Number of rows inserted or changed.
+    """
+    try:
+        with connection.transaction():
+            with connection.cursor() as cursor:
+                with connection.pipeline():
+                    cursor.executemany(INSERT_APPLICANT_QUERY, rows)
+                # Row counts are only known once the pipeline has been synced
+                changed = cursor.rowcount
+        return changed
+    except DeadlockDetected:
+        raise
+    except Exception as err:
+        logger.warning(
+            "Batch insert of records #%d-#%d failed (%s); retrying them one by one.",
+            numbers[0], numbers[-1], err
+        )
+        return _insert_rows_individually(connection, numbers, rows)
+
+
+def _load_file(
+    connection: Connection,
+    json_path: str,
+    method: str,
+    chunk_size: int,
+) -> tuple[int, int]:
+    """Stream one file into the applicants table in a single transaction.
+
+    Loads of overlapping files running at the same time can deadlock on the rows they share.
+    The server then aborts one of them; its transaction is rolled back and the file is loaded
+    again, up to DEADLOCK_RETRIES times, rather than skipping the rows that were involved.
+
+    Args:
+        connection (Connection): psycopg3 database connection.
+        json_path (str): Path to the JSON or JSON Lines file.
+        method (str): One of LOAD_METHODS.
+        chunk_size (int): Records converted and sent to the server at a time.
+
+    Returns:
+        tuple[int, int]: Records read from the file and records inserted or updated.
+
+    Raises:
+        DeadlockDetected: If the file still deadlocks after DEADLOCK_RETRIES retries.
+    """
+    load_rows = {
+        "copy": _copy_rows,
+        "executemany": _executemany_rows,
+        "insert": _insert_rows_individually,
+    }[method]
+
+    def load_chunk(numbers: list[int], records: list[ApplicantRecord]) -> int:
+        numbers, rows = _convert_chunk(numbers, records)
+        return load_rows(connection, numbers, rows) if rows else 0
+
+    retries = 0
+    while True:
+        count = 0
+        inserted = 0
+        numbers: list[int] = []
+        records: list[ApplicantRecord] = []
+        try:
+            # One transaction for the whole file; the per-chunk and per-row blocks are savepoints
+            with connection.transaction():
+                for count, record in enumerate(iter_json_data(json_path), start=1):
+                    numbers.append(count)
+                    records.append(record)
+                    if len(records) >= chunk_size:
+                        inserted += load_chunk(numbers, records)
+                        numbers, records = [], []
+                if records:
+                    inserted += load_chunk(numbers, records)
+            return count, inserted
+        except DeadlockDetected as err:
+            retries += 1
+            if retries > DEADLOCK_RETRIES:
+                raise
+            logger.warning(
+                "Deadlock while loading %s (%s); loading it again (retry %d of %d).",
+                json_path, str(err).splitlines()[0], retries, DEADLOCK_RETRIES
+            )
+            # Back off a little, longer each time, so the other load can finish first
+            time.sleep(0.1 * retries)
+
+
+def _check_load_options(method: str, chunk_size: int) -> None:
+    if method not in LOAD_METHODS:
+        raise ValueError(f"Unknown load method: {method}. Expected one of {LOAD_METHODS}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+
+def load_applicants(
+    connection: Connection,
+    json_path: str = DATA_FILE,
+    method: str = "copy",
+    chunk_size: int = 10_000,
+) -> None:
+    """Load all applicants from the JSON file into the database.
+
+    Records are streamed from the file and loaded ``chunk_size`` at a time, all in one
+    transaction that is committed at the end. Loading is idempotent: records are upserted on
+    their URL, so reloading a file, or loading files that overlap, updates the entries already
+    there instead of duplicating them. Within a file, the last record for a URL wins. With the
+    default "copy" method each chunk goes to the server in one COPY FROM STDIN. Where COPY is
+    not permitted, "executemany" sends each chunk as one pipelined batch of INSERTs, and
+    "insert" sends one INSERT per record. Either way a record that cannot be loaded is logged as
+    "Failed to insert record #<n>" and skipped.
+
+    Args:
+        connection (Connection): psycopg3 database connection.
+        json_path (str): Path to the JSON or JSON Lines file.
+        method (str): "copy" (bulk COPY), "executemany" (batched INSERTs) or "insert"
+            (one INSERT per record).
+        chunk_size (int): Records converted and sent to the server at a time (the COPY chunk
+            or executemany batch size).
+
+    Raises:
+        ValueError: If method is unknown or chunk_size is less than 1.
+    """
+    _check_load_options(method, chunk_size)
+
+    try:
+        create_applicants_table(connection)
+        count, inserted = _load_file(connection, json_path, method, chunk_size)
+        if inserted:
+            refresh_applicant_summary(connection)
+            invalidate_query_cache()
+        logger.info(
+            "Inserted or updated %d of %d records in 'applicants' table (%s).", inserted, count,
+            method
+        )
 
     except Exception as err:
         logger.exception("Failed to load applicants: %s", err)
         connection.rollback()
         logger.error("Transaction rolled back due to error.")
+
+
+class FileLoadResult(TypedDict):
+    """Outcome of loading one file with load_applicant_files."""
+    path: str
+    records: int
+    loaded: int
+    seconds: float
+    error: Optional[str]
+
+
+def _open_connection(conninfo: Optional[str]) -> Connection:
+    connection = connect(conninfo) if conninfo else connect_to_database()
+    if connection is None:
+        raise ConnectionError("Could not connect to the database.")
+    return connection
+
+
+def _load_file_worker(
+    json_path: str,
+    method: str,
+    chunk_size: int,
+    conninfo: Optional[str],
+) -> FileLoadResult:
+    """Load one file over a connection of its own; runs in a worker process."""
+    started = time.perf_counter()
+    result = FileLoadResult(path=json_path, records=0, loaded=0, seconds=0.0, error=None)
+    try:
+        with _open_connection(conninfo) as connection:
+            result["records"], result["loaded"] = _load_file(
+                connection, json_path, method, chunk_size
+            )
+    except Exception as err:
+        result["error"] = f"{type(err).__name__}: {err}"
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def load_applicant_files(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    method: str = "copy",
+    chunk_size: int = 10_000,
+    conninfo: Optional[str] = None,
+) -> list[FileLoadResult]:
+    """Load several JSON or JSON Lines files into the database in parallel.
+
+    Each file is read, converted and streamed to the server by a worker process over its own
+    connection, so up to ``workers`` COPY streams run at the same time. Every file is loaded in
+    its own transaction, as load_applicants does; a file that fails is rolled back and reported
+    without stopping the others. The table and its indexes are created once up front, before the
+    workers start.
+
+    Records are upserted on their URL, so files can overlap and be reloaded safely. Overlapping
+    files loaded at the same time can deadlock on the rows they share; the file whose load the
+    server aborts is then loaded again. Which file's version of a shared URL is kept is not
+    defined either; pass ``workers=1`` to load the files in order, the last file winning.
+
+    Args:
+        paths (Iterable[str]): JSON or JSON Lines files to load.
+        workers (Optional[int]): Worker processes (and connections). Defaults to the CPU count,
+            capped at the number of files. 1 loads the files one after the other in this process.
+        method (str): Load method of every file, as for load_applicants.
+        chunk_size (int): Records sent to the server at a time, as for load_applicants.
+        conninfo (Optional[str]): libpq connection string; defaults to the .env settings used by
+            connect_to_database.
+
+    Returns:
+        list[FileLoadResult]: Records read and loaded, seconds taken and error (None on success)
+        of each file, in the order given.
+
+    Raises:
+        ValueError: If method is unknown, or chunk_size or workers is less than 1.
+    """
+    _check_load_options(method, chunk_size)
+    paths = list(paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1.")
+    workers = min(workers, len(paths)) or 1
+
+    started = time.perf_counter()
+    results: list[FileLoadResult] = []
+    try:
+        # Concurrent CREATE ... IF NOT EXISTS statements can conflict, so create everything once
+        with _open_connection(conninfo) as connection:
+            create_applicants_table(connection)
+
+        jobs = [(path, method, chunk_size, conninfo) for path in paths]
+        if workers == 1:
+            results = [_load_file_worker(*job) for job in jobs]
+        else:
+            # spawn: a forked child would inherit the parent's connections and threads
+            with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as executor:
+                results = list(executor.map(_load_file_worker, *zip(*jobs)))
+    except Exception as err:
+        logger.exception("Failed to load applicant files: %s", err)
+        return results
+
+    # Each worker committed its own file; the summary and cached analytics are stale once any
+    # rows changed
+    if any(result["loaded"] for result in results):
+        try:
+            with _open_connection(conninfo) as connection:
+                refresh_applicant_summary(connection)
+        except Exception as err:
+            logger.error("Failed to refresh the applicant summary: %s", err)
+        invalidate_query_cache()
+
+    for result in results:
+        if result["error"]:
+            logger.error("Failed to load %s: %s", result["path"], result["error"])
+        else:
+            logger.info(
+                "Inserted or updated %d of %d records from %s in %.2fs (%.0f records/s).",
+                result["loaded"], result["records"], result["path"], result["seconds"],
+                result["records"] / result["seconds"] if result["seconds"] else 0.0
+            )
+    elapsed = time.perf_counter() - started
+    records = sum(result["records"] for result in results)
+    logger.info(
+        "Loaded %d files (%d failed), %d records in %.2fs (%.0f records/s, %d workers, %s).",
+        len(results), sum(1 for result in results if result["error"]), records, elapsed,
+        records / elapsed if elapsed else 0.0, workers, method
+    )
+    return results
@@ -2,20 +2,34 @@
 Module: query_data.py
 Author: Billy Presume
 Created: 2025-06-04
-Modified: 2025-06-17
+Modified: 2026-10-18
 Description: Secure query execution using psycopg3 with full type safety and logging.
+execute_query returns every row at once; iter_query streams them from a server-side cursor.
+Queries run on every page view are registered once by name (register_query) and run with
+execute_named_query as prepared statements.
 """
 
+import itertools
 import logging
-from typing import Any, Sequence
+from typing import Any, Iterator, Mapping, Sequence
 
 from psycopg import Connection
 from psycopg.errors import OperationalError, ProgrammingError, IntegrityError, DatabaseError
-from psycopg.sql import SQL, Composed
+from psycopg.sql import SQL, Composable, Composed
+
+from src.utils.database import get_pool
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Server-side cursor names must be unique within a session
+_cursor_ids = itertools.count(1)
+
+# Registered queries by name; see register_query
+NAMED_QUERIES: dict[str, Composable] = {}
+
+Params = Sequence[Any] | Mapping[str, Any]
+
 
 def execute_query(
     connection: Connection | None,
@@ -25,8 +39,11 @@ def execute_query(
     """
     Executes a parameterized or composed SQL query using psycopg3.
 
+    Without a connection, one is borrowed from the application-wide pool (see
+    src.utils.database.init_pool) for the duration of the query and returned to it afterwards.
+
     Args:
-        connection (Connection | None): A valid psycopg3 connection.
+        connection (Connection | None): A valid psycopg3 connection, or None to use the pool.
         query (str | SQL | Composed): SQL query (raw or composed).
         params (Sequence[Any] | None): Query parameters.
 
@@ -34,12 +51,18 @@ def execute_query(
         list[tuple[Any, ...]] | None: Rows for SELECT queries, else None.
 
     Raises:
-        ValueError: If connection is invalid.
+        ValueError: If connection is invalid, or None while no pool has been created.
     """
+    if connection is None and get_pool() is not None:
+        with get_pool().connection() as pooled:  # type: ignore
+            return execute_query(pooled, query, params)
+
     if connection is None or connection.closed:
         raise ValueError("Database connection is not open.")
 
     try:
+        if isinstance(query, Composable):
+            query = query.as_string(connection)
         with connection.cursor() as cursor:
             cursor.execute(SQL(query), params)  # type: ignore
 
@@ -60,3 +83,133 @@ def execute_query(
         logger.exception("Unexpected error: %s", err)
 
     return None
+
+
+def iter_query(
+    connection: Connection | None,
+    query: str | SQL | Composed,
+    params: Sequence[Any] | None = None,
+    batch_size: int = 2_000,
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Streams the rows of a SELECT query from a named (server-side) cursor.
+
+    The server keeps the result and sends it ``batch_size`` rows at a time, fetched with
+    fetchmany, so a query over the whole applicants table runs in constant client memory.
+    Without a connection, one is borrowed from the application-wide pool until the iteration
+    ends. On an autocommit connection the cursor is declared WITH HOLD, since server-side
+    cursors otherwise only live inside a transaction.
+
+    Args:
+        connection (Connection | None): A valid psycopg3 connection, or None to use the pool.
+        query (str | SQL | Composed): SELECT query (raw or composed).
+        params (Sequence[Any] | None): Query parameters.
+        batch_size (int): Rows fetched from the server per round trip.
+
+    Yields:
+        tuple[Any, ...]: Each row of the result, in order.
+
+    Raises:
+        ValueError: If batch_size is less than 1, or connection is invalid, or None while no
+            pool has been created.
+        psycopg.Error: If the query fails; the error is logged and the transaction rolled back.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    if connection is None and get_pool() is not None:
+        with get_pool().connection() as pooled:  # type: ignore
+            yield from iter_query(pooled, query, params, batch_size)
+        return
+
+    if connection is None or connection.closed:
+        raise ValueError("Database connection is not open.")
+
+    if isinstance(query, Composable):
+        query = query.as_string(connection)
+    try:
+        with connection.cursor(
+            name=f"iter_query_{next(_cursor_ids)}", withhold=connection.autocommit
+        ) as cursor:
+            cursor.execute(SQL(query), params)  # type: ignore
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+    except DatabaseError as err:
+        connection.rollback()
+        logger.error("Database error occurred while streaming: %s", err)
+        raise
+
+
+def register_query(name: str, query: str | SQL | Composed) -> None:
+    """
+    Declares a parameterized query under a name, to be run with execute_named_query.
+
+    Values must be placeholders (%s, or %(name)s with psycopg.sql.Placeholder) rather than
+    Literals, so that the same prepared statement serves every call whatever the values.
+
+    Args:
+        name (str): Name of the query.
+        query (str | SQL | Composed): SQL query (raw or composed).
+
+    Raises:
+        ValueError: If another query is already registered under the name.
+    """
+    composed = query if isinstance(query, Composable) else SQL(query)  # type: ignore
+    if name in NAMED_QUERIES and NAMED_QUERIES[name] != composed:
+        raise ValueError(f"A different query is already registered as '{name}'.")
+    NAMED_QUERIES[name] = composed
+
+
+def execute_named_query(
+    name: str,
+    params: Params | None = None,
+    connection: Connection | None = None,
+) -> list[tuple[Any, ...]] | None:
+    """
+    Runs a registered query as a prepared statement.
+
+    psycopg prepares the statement on the first call on each connection and afterwards only
+    sends its name and parameters, so with the application pool the server parses and plans
+    each query once per pooled connection rather than once per call.
+
+    Args:
+        name (str): Name given to register_query.
+        params (Params | None): Query parameters.
+        connection (Connection | None): A valid psycopg3 connection, or None to use the pool.
+
+    Returns:
+        list[tuple[Any, ...]] | None: Rows for queries that return rows, else None. None on
+        database errors as well, which are logged and rolled back.
+
+    Raises:
+        ValueError: If no query is registered under the name, or connection is invalid, or
+            None while no pool has been created.
+    """
+    if name not in NAMED_QUERIES:
+        raise ValueError(f"No query is registered as '{name}'.")
+
+    if connection is None and get_pool() is not None:
+        with get_pool().connection() as pooled:  # type: ignore
+            return execute_named_query(name, params, pooled)
+
+    if connection is None or connection.closed:
+        raise ValueError("Database connection is not open.")
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(NAMED_QUERIES[name], params, prepare=True)
+            if cursor.description is not None:
+                return cursor.fetchall()
+
+            connection.commit()
+            logger.info("Named query '%s' executed successfully.", name)
+            return None
+
+    except (OperationalError, ProgrammingError, IntegrityError, DatabaseError) as err:
+        connection.rollback()
+        logger.error("Database error occurred in query '%s': %s", name, err)
+    except Exception as err:
+        connection.rollback()
+        logger.exception("Unexpected error in query '%s': %s", name, err)
+
+    return None
@@ -2,7 +2,7 @@
 Module: routes.py
 Author: Billy Presume
 Created: 2025-06-04
-Modified: 2025-06-17
+Modified: 2026-10-18
 
 Description:
     Defines route endpoints using Flask Blueprints, performs safe SQL query execution,
@@ -11,15 +11,18 @@ Description:
 
 import logging
 import os
-from typing import Any
+from typing import Any, Mapping
 
 from flask import Blueprint, render_template
-from psycopg import Connection
-from psycopg.sql import SQL, Identifier, Literal, Composed
 
-from src.website.query_data import execute_query
-from src.utils.database import connect_to_database
-from src.website.load_data import load_applicants
+from src.website.query_data import execute_named_query
+from src.utils.database import connect_to_database, get_pool
+from src.utils.query_cache import get_query_cache
+from src.website.dashboard import (
+    DASHBOARD_METRICS, DASHBOARD_PARAMS, DASHBOARD_QUERY_NAME, DASHBOARD_SUMMARY_QUERY_NAME,
+    SUMMARY_EXISTS_QUERY_NAME
+)
+from src.website.load_data import DATA_FILE, load_applicant_files
 
 logger = logging.getLogger(__name__)
 views = Blueprint("views", __name__)
@@ -29,20 +32,34 @@ DATA_FILE_2 = os.path.join(
 )
 
 
+class _DashboardState:
+    """Remembers whether dashboard_metrics has already logged falling back to the table."""
+
+    fallback_logged = False
+
+
+_dashboard_state = _DashboardState()
+
+
 def load_if_first_time() -> None:
     """
     Loads applicant data from JSON files into the database if environment variable is set.
 
+    The files overlap, so they are loaded one after the other (the second file's version of a
+    shared entry wins) rather than by parallel workers contending for the same rows. Entries are
+    upserted on their URL, so entries present in both files are stored once and running the load
+    again does not duplicate data.
+
     Side Effects:
         Modifies the `.env` file to disable subsequent loads.
     """
     if os.getenv("LOAD_DATA_ON_FIRST_RUN") == "1":
         try:
             logger.info("First run detected. Loading applicants into database...")
-            connection: Connection = connect_to_database()  # type: ignore
-            load_applicants(connection)
-            load_applicants(connection, DATA_FILE_2)
-            connection.close()
+            results = load_applicant_files([DATA_FILE, DATA_FILE_2], workers=1)
+            if not results or any(result["error"] for result in results):
+                logger.error("Initial applicant data was not fully loaded; will retry next run.")
+                return
 
             env_path = ".env"
             if not os.path.exists(env_path):
@@ -69,25 +86,75 @@ def load_if_first_time() -> None:
             logger.exception("Failed to load initial applicant data: %s", e)
 
 
-def safe_fetch_query(query: Composed) -> list[tuple[Any, ...]]:
+def dashboard_metrics() -> dict[str, Any]:
     """
-    Executes a SQL query (psycopg Composed) and returns results or an empty list on failure.
+    Computes every homepage metric from the applicant_summary materialized view.
+
+    Falls back to aggregating the applicants table (DASHBOARD_QUERY) if the view does not exist
+    yet, i.e. before the first load through load_data. Whether it exists is checked with a
+    catalog lookup that is cached like the metrics, so a missing view costs no failing query
+    and the view is picked up once a load has created it. The fallback is logged once per
+    process. All three run as prepared named queries.
+
+    Returns:
+        dict[str, Any]: Metric values keyed by DASHBOARD_METRICS names; all None if both
+        queries failed.
+    """
+    rows: list[tuple[Any, ...]] = []
+    exists = safe_fetch_named_query(SUMMARY_EXISTS_QUERY_NAME)
+    if exists and exists[0][0]:
+        rows = safe_fetch_named_query(DASHBOARD_SUMMARY_QUERY_NAME, DASHBOARD_PARAMS)
+    if not rows:
+        if not _dashboard_state.fallback_logged:
+            logger.warning(
+                "No applicant_summary view to read; aggregating the applicants table instead."
+            )
+            _dashboard_state.fallback_logged = True
+        rows = safe_fetch_named_query(DASHBOARD_QUERY_NAME, DASHBOARD_PARAMS)
+    values = rows[0] if rows else (None,) * len(DASHBOARD_METRICS)
+    return dict(zip(DASHBOARD_METRICS, values))
+
+
+def safe_fetch_named_query(
+    name: str, params: Mapping[str, Any] | None = None
+) -> list[tuple[Any, ...]]:
+    """
+    Runs a registered query (see query_data.register_query) and returns results or an empty
+    list on failure.
+
+    Results are served from the query cache, keyed by the query name and parameters, while
+    they are fresh; the loaders invalidate it when new applicants are committed. Otherwise the
+    query runs as a prepared statement on a connection borrowed from the application pool, or
+    on a connection of its own if the pool was not created, and successful results are cached.
 
     Args:
-        query (Composed): psycopg SQL Composed query.
+        name (str): Name of the registered query.
+        params (Mapping[str, Any] | None): Query parameters.
 
     Returns:
         list[tuple[Any, ...]]: Query results or empty list if failed.
     """
     try:
-        connection = connect_to_database()
-        query_str = query.as_string(connection)
-        results = execute_query(connection, query_str)
-        if connection and not connection.closed:
-            connection.close()
+        cache = get_query_cache()
+        key = f"{name}:{sorted((params or {}).items())!r}"
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        if get_pool() is not None:
+            results = execute_named_query(name, params)
+        else:
+            connection = connect_to_database()
+            results = execute_named_query(name, params, connection)
+            if connection and not connection.closed:
+                connection.close()
+
+        # None means the query failed; only real results are cached
+        if results is not None:
+            cache.set(key, results)
         return results or []
     except Exception as e:
-        logger.error("Query failed: %s\nError: %s", query, e)
+        logger.error("Query '%s' failed: %s", name, e)
         return []
 
 
@@ -97,142 +164,60 @@ def home() -> str:
     """
     Renders the homepage with analytics derived from the applicants database.
 
+    Every metric comes from one query over the pre-aggregated applicant_summary view, so the
+    cost of a page view does not grow with the number of applicants.
+
     Returns:
         str: Rendered HTML page.
     """
+    metrics = dashboard_metrics()
     questions: list[tuple[str, list[str], list[Any]]] = []
 
-    table = Identifier("applicants")
-
-    # 1. Count of entries for Fall 2025 (LIMIT 1)
-    query1 = SQL("SELECT COUNT(*) FROM {table} WHERE term = {term} LIMIT 1").format(
-        table=table, term=Literal("Fall 2025")
-    )
-    fall_2025_count_res = safe_fetch_query(query1)
-    fall_2025_count = fall_2025_count_res[0][0] if fall_2025_count_res else 0
-
+    # 1. Count of entries for Fall 2025
+    fall_2025_count = metrics["fall_2025_count"] or 0
     questions.append(
         ("How many entries applied for Fall 2025?", ["Total Entries"], [fall_2025_count])
     )
 
-    # 2. International applicant count and total count (LIMIT 1 each)
-    query2_intl = SQL(
-        "SELECT COUNT(*) FROM {table} WHERE us_or_international NOT IN ({amer}, {other}) LIMIT 1"
-    ).format(
-        table=table,
-        amer=Literal("American"),
-        other=Literal("Other"),
-    )
-    intl_res = safe_fetch_query(query2_intl)
-    intl_count = intl_res[0][0] if intl_res else 0
-
-    query2_total = SQL("SELECT COUNT(*) FROM {table} LIMIT 1").format(table=table)
-    total_res = safe_fetch_query(query2_total)
-    total_count = total_res[0][0] if total_res else 0
-
+    # 2. International applicant count and total count
+    intl_count = metrics["international_count"] or 0
+    total_count = metrics["total_count"] or 0
     intl_percent = round((intl_count / total_count) * 100, 2) if total_count else 0
     questions.append((
         "What percentage of entries are international?", ["International %"], [f"{intl_percent}%"]
     ))
 
-    # 3. Average GPA, GRE, GRE V, GRE AW (LIMIT 1)
-    query3 = SQL(
-        """
-        SELECT 
-            ROUND(AVG(gpa)::NUMERIC, 2), 
-            ROUND(AVG(gre)::NUMERIC, 1), 
-            ROUND(AVG(gre_v)::NUMERIC, 1), 
-            ROUND(AVG(gre_aw)::NUMERIC, 2)
-        FROM {table}
-        WHERE gpa IS NOT NULL OR gre IS NOT NULL OR gre_v IS NOT NULL OR gre_aw IS NOT NULL
-        LIMIT 1
-        """
-    ).format(table=table)
-    q3_result = safe_fetch_query(query3)
-    averages = q3_result[0] if q3_result else (None, None, None, None)
+    # 3. Average GPA, GRE, GRE V, GRE AW
+    averages = [metrics["avg_gpa"], metrics["avg_gre"], metrics["avg_gre_v"], metrics["avg_gre_aw"]]
     questions.append((
         "Average GPA, GRE, GRE V, GRE AW for all applicants providing those values?",
-        ["Avg. GPA", "Avg. GRE", "Avg. GRE V", "Avg. GRE AW"], list(averages)
+        ["Avg. GPA", "Avg. GRE", "Avg. GRE V", "Avg. GRE AW"], averages
     ))
 
-    # 4. Average GPA of American students in Fall 2025 (LIMIT 1)
-    query4 = SQL(
-        """
-        SELECT ROUND(AVG(gpa)::NUMERIC, 2) FROM {table}
-        WHERE us_or_international = {amer} AND term = {term} AND gpa IS NOT NULL
-        LIMIT 1
-        """
-    ).format(
-        table=table,
-        amer=Literal("American"),
-        term=Literal("Fall 2025"),
-    )
-    avg_gpa_american_res = safe_fetch_query(query4)
-    avg_gpa_american = avg_gpa_american_res[0][0] if avg_gpa_american_res else None
+    # 4. Average GPA of American students in Fall 2025
     questions.append((
         "Average GPA of American students applying for Fall 2025?", ["Avg. American GPA"],
-        [avg_gpa_american]
+        [metrics["avg_gpa_american_fall_2025"]]
     ))
 
-    # 5. Acceptance count and acceptance percentage for Fall 2025 (LIMIT 1)
-    query5 = SQL(
-        """
-        SELECT COUNT(*) FROM {table}
-        WHERE status ILIKE {accepted} AND term = {term}
-        LIMIT 1
-        """
-    ).format(
-        table=table,
-        accepted=Literal("Accepted"),
-        term=Literal("Fall 2025"),
-    )
-    accepted_count_res = safe_fetch_query(query5)
-    accepted_count = accepted_count_res[0][0] if accepted_count_res else 0
-
+    # 5. Acceptance count and acceptance percentage for Fall 2025
+    accepted_count = metrics["accepted_fall_2025_count"] or 0
     acceptance_percent = round((accepted_count / fall_2025_count) *
                                100, 2) if fall_2025_count else 0
     questions.append(
         ("Acceptance percentage for Fall 2025?", ["Acceptance %"], [f"{acceptance_percent}%"])
     )
 
-    # 6. GPA of accepted Fall 2025 applicants (LIMIT 1)
-    query6 = SQL(
-        """
-        SELECT ROUND(AVG(gpa)::NUMERIC, 2) FROM {table}
-        WHERE term = {term} AND status ILIKE {accepted} AND gpa IS NOT NULL
-        LIMIT 1
-        """
-    ).format(
-        table=table,
-        term=Literal("Fall 2025"),
-        accepted=Literal("Accepted"),
-    )
-    accepted_gpa_res = safe_fetch_query(query6)
-    accepted_gpa = accepted_gpa_res[0][0] if accepted_gpa_res else None
-    questions.append(
-        ("Average GPA for accepted applicants in Fall 2025?", ["Avg. GPA"], [accepted_gpa])
-    )
+    # 6. GPA of accepted Fall 2025 applicants
+    questions.append((
+        "Average GPA for accepted applicants in Fall 2025?", ["Avg. GPA"],
+        [metrics["avg_gpa_accepted_fall_2025"]]
+    ))
 
-    # 7. JHU CS Masters applicants (LIMIT 1)
-    query7 = SQL(
-        """
-        SELECT COUNT(*) FROM {table}
-        WHERE university ILIKE {jhu}
-        AND program ILIKE {cs}
-        AND degree ILIKE {master}
-        LIMIT 1
-        """
-    ).format(
-        table=table,
-        jhu=Literal("%JHU%"),
-        cs=Literal("%Computer Science%"),
-        master=Literal("%Master%"),
-    )
-    jhu_cs_count_res = safe_fetch_query(query7)
-    jhu_cs_count = jhu_cs_count_res[0][0] if jhu_cs_count_res else 0
+    # 7. JHU CS Masters applicants
     questions.append((
         "How many applicants applied to JHU for a CS Master's?", ["JHU CS Masters Applicants"],
-        [jhu_cs_count]
+        [metrics["jhu_cs_masters_count"] or 0]
     ))
 
     context: dict[str, list[tuple[Any, ...]] |
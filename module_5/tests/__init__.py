@@ -0,0 +1,8 @@
+"""
+Module: __init__.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Package initializer for the tests module. Allows pytest to
+discover and execute test files in this directory.
+"""
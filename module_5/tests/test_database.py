@@ -0,0 +1,201 @@
+"""
+Module: test_database.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Unit tests for the application-wide connection pool and for the connection
+fallback when no pool exists. psycopg_pool and the database connections are stubbed, so no
+database is needed.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import pytest
+
+from src.utils import database
+from src.utils.query_cache import NullQueryCache
+from src.website import create_app, routes
+from src.website.query_data import execute_query, register_query
+
+
+class StubCursor:
+    """Cursor that records its statements and returns one fixed row."""
+
+    description = [("value", None)]
+
+    def __init__(self, connection: "StubConnection") -> None:
+        self.connection = connection
+
+    def __enter__(self) -> "StubCursor":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        pass
+
+    def execute(self, query: Any, params: Any = None, **_kwargs: Any) -> None:
+        """Record the statement."""
+        self.connection.executed.append((query, params))
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        """Return the fixed row."""
+        return [(self.connection.name, )]
+
+
+class StubConnection:
+    """Connection that records what was executed on it."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.closed = False
+        self.executed: list[tuple[Any, Any]] = []
+
+    def cursor(self) -> StubCursor:
+        """Return a recording cursor."""
+        return StubCursor(self)
+
+    def commit(self) -> None:
+        """Do nothing."""
+
+    def rollback(self) -> None:
+        """Do nothing."""
+
+    def close(self) -> None:
+        """Mark the connection closed."""
+        self.closed = True
+
+
+class StubPool:
+    """Stand-in for psycopg_pool.ConnectionPool lending out a single connection."""
+
+    check_connection = staticmethod(lambda connection: None)
+    created: list["StubPool"] = []
+
+    def __init__(self, conninfo: str, **kwargs: Any) -> None:
+        self.conninfo = conninfo
+        self.min_size = kwargs["min_size"]
+        self.max_size = kwargs["max_size"]
+        self.opened: Optional[bool] = None
+        self.closed = False
+        self.borrowed = 0
+        self.lent = StubConnection("pooled")
+        StubPool.created.append(self)
+
+    def open(self, wait: bool = True) -> None:
+        """Record how the pool was opened."""
+        self.opened = wait
+
+    def close(self) -> None:
+        """Mark the pool closed."""
+        self.closed = True
+
+    @contextmanager
+    def connection(self) -> Iterator[StubConnection]:
+        """Lend the pool's connection."""
+        self.borrowed += 1
+        yield self.lent
+
+
+@pytest.fixture(name="stub_pool")
+def fixture_stub_pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[type[StubPool]]:
+    """
+    Replaces ConnectionPool with StubPool and makes sure no pool is left over afterwards.
+    """
+    StubPool.created = []
+    monkeypatch.setattr(database, "ConnectionPool", StubPool)
+    monkeypatch.setattr(database.atexit, "register", lambda function: None)
+    database.close_pool()
+    yield StubPool
+    database.close_pool()
+
+
+def test_init_pool_creates_one_pool(
+    monkeypatch: pytest.MonkeyPatch, stub_pool: type[StubPool]
+) -> None:
+    """
+    Test that init_pool creates the pool once, sized from the environment, and that close_pool
+    closes and forgets it.
+
+    Asserts:
+        - The pool is sized from DB_POOL_MIN_SIZE and DB_POOL_MAX_SIZE and opened without waiting.
+        - Later calls return the same pool, which get_pool exposes.
+        - close_pool closes the pool and get_pool then returns None.
+    """
+    monkeypatch.setenv("DB_POOL_MIN_SIZE", "2")
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "4")
+
+    pool = database.init_pool("dbname=test")
+    assert database.init_pool("dbname=other") is pool
+    assert database.get_pool() is pool
+    assert len(stub_pool.created) == 1
+    assert (pool.conninfo, pool.min_size, pool.max_size) == ("dbname=test", 2, 4)
+    assert pool.opened is False
+
+    database.close_pool()
+    assert pool.closed
+    assert database.get_pool() is None
+
+
+def test_create_app_opens_pool_only_in_main_process(
+    monkeypatch: pytest.MonkeyPatch, stub_pool: type[StubPool]
+) -> None:
+    """
+    Test that create_app opens the connection pool in the serving process but not in a
+    multiprocessing worker, which imports app.py again.
+
+    Asserts:
+        - In a worker, the app is created without a pool.
+        - In the main process, the app is created with one pool.
+    """
+    monkeypatch.setattr(database, "database_conninfo", lambda: "dbname=test")
+    monkeypatch.setattr("src.website.multiprocessing.parent_process", object)
+    assert create_app() is not None
+    assert database.get_pool() is None
+    assert not stub_pool.created
+
+    monkeypatch.setattr("src.website.multiprocessing.parent_process", lambda: None)
+    create_app()
+    assert database.get_pool() is stub_pool.created[0]
+    assert len(stub_pool.created) == 1
+
+
+def test_execute_query_borrows_from_the_pool(stub_pool: type[StubPool]) -> None:
+    """
+    Test that a query without a connection runs on a connection borrowed from the pool.
+
+    Asserts:
+        - The rows come from the pooled connection.
+        - Without a pool, a query without a connection is rejected.
+    """
+    pool = database.init_pool("dbname=test")
+    assert execute_query(None, "SELECT 1") == [("pooled", )]
+    assert stub_pool.created[0].borrowed == 1
+
+    database.close_pool()
+    with pytest.raises(ValueError):
+        execute_query(None, "SELECT 1")
+    assert pool.borrowed == 1
+
+
+def test_named_query_falls_back_to_own_connection(
+    monkeypatch: pytest.MonkeyPatch, stub_pool: type[StubPool]
+) -> None:
+    """
+    Test that, with no pool, the homepage queries open and close a connection of their own.
+
+    Asserts:
+        - The query runs on a connection from connect_to_database.
+        - That connection is closed afterwards.
+        - With a pool, the pooled connection is used instead.
+    """
+    register_query("test_database_value", "SELECT %(value)s")
+    monkeypatch.setattr(routes, "get_query_cache", NullQueryCache)
+    own = StubConnection("own")
+    monkeypatch.setattr(routes, "connect_to_database", lambda: own)
+
+    assert routes.safe_fetch_named_query("test_database_value", {"value": 1}) == [("own", )]
+    assert own.closed
+
+    database.init_pool("dbname=test")
+    assert routes.safe_fetch_named_query("test_database_value", {"value": 1}) == [("pooled", )]
+    assert stub_pool.created[0].borrowed == 1
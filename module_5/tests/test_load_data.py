@@ -0,0 +1,101 @@
+"""
+Module: test_load_data.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Unit tests for the applicant loader that need no database: a stub connection stands
+in for psycopg, and the chunk loaders are replaced by fakes.
+"""
+# pylint: disable=protected-access
+
+import json
+from contextlib import nullcontext
+from typing import Any
+
+import pytest
+from psycopg.errors import DeadlockDetected
+
+from src.website import load_data
+
+
+class DeadlockingCursor:
+    """Cursor whose every statement is aborted as a deadlock victim."""
+
+    def __enter__(self) -> "DeadlockingCursor":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        pass
+
+    def execute(self, *_args: Any) -> None:
+        """Fail like a statement chosen as a deadlock victim."""
+        raise DeadlockDetected("deadlock detected")
+
+
+class StubConnection:
+    """Connection whose transactions do nothing and whose statements deadlock."""
+
+    def transaction(self) -> Any:
+        """Return a no-op transaction block."""
+        return nullcontext()
+
+    def cursor(self) -> DeadlockingCursor:
+        """Return a cursor whose statements deadlock."""
+        return DeadlockingCursor()
+
+
+@pytest.fixture(name="json_path")
+def fixture_json_path(tmp_path: Any) -> str:
+    """
+    Writes a file of five applicant records and returns its path.
+    """
+    path = tmp_path / "applicants.json"
+    path.write_text(json.dumps([{"url": f"/result/{n}"} for n in range(5)]), encoding="utf-8")
+    return str(path)
+
+
+def test_load_file_retries_after_deadlock(
+    monkeypatch: pytest.MonkeyPatch, json_path: str
+) -> None:
+    """
+    Test that a file whose load deadlocks is loaded again from the start.
+
+    Asserts:
+        - The counts returned are those of the attempt that succeeded.
+        - Every chunk of the file is loaded again after the deadlock.
+    """
+    calls: list[list[int]] = []
+
+    def fake_copy_rows(_connection: Any, numbers: list[int], rows: list[Any]) -> int:
+        calls.append(numbers)
+        if len(calls) == 2:
+            raise DeadlockDetected("deadlock detected")
+        return len(rows)
+
+    monkeypatch.setattr(load_data, "_copy_rows", fake_copy_rows)
+    monkeypatch.setattr(load_data.time, "sleep", lambda _seconds: None)
+
+    assert load_data._load_file(StubConnection(), json_path, "copy", 2) == (5, 5)  # type: ignore
+    assert calls == [[1, 2], [3, 4], [1, 2], [3, 4], [5]]
+
+
+def test_load_file_gives_up_after_deadlock_retries(
+    monkeypatch: pytest.MonkeyPatch, json_path: str
+) -> None:
+    """
+    Test that a file that keeps deadlocking fails instead of being loaded row by row.
+
+    Asserts:
+        - DeadlockDetected is raised once DEADLOCK_RETRIES retries have failed.
+        - The COPY chunk loader never falls back to loading rows one by one.
+    """
+    def fail_individual_rows(*_args: Any) -> int:
+        raise AssertionError("rows must not be loaded one by one after a deadlock")
+
+    monkeypatch.setattr(load_data, "_insert_rows_individually", fail_individual_rows)
+    sleeps: list[float] = []
+    monkeypatch.setattr(load_data.time, "sleep", sleeps.append)
+
+    with pytest.raises(DeadlockDetected):
+        load_data._load_file(StubConnection(), json_path, "copy", 10)  # type: ignore
+    assert len(sleeps) == load_data.DEADLOCK_RETRIES
@@ -0,0 +1,210 @@
+"""
+Module: test_query_cache.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Unit tests for the query result cache backends: expiry, least recently used
+eviction, the SQLite file format and permissions, and invalidation. No database is needed.
+"""
+# pylint: disable=protected-access
+
+import os
+import stat
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from flask import Flask
+
+from src.utils import query_cache
+from src.utils.query_cache import (
+    MemoryQueryCache, NullQueryCache, QueryCache, SQLiteQueryCache, create_query_cache, dumps_rows,
+    invalidate_query_cache, loads_rows
+)
+
+ROWS = [(1, Decimal("3.50"), 2.25, "Fall 2025", None, date(2025, 5, 1), datetime(2025, 5, 1, 9))]
+
+
+class Clock:
+    """Settable stand-in for time.monotonic and time.time."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    """
+    Freezes the clocks the caches read.
+    """
+    clock = Clock()
+    monkeypatch.setattr(query_cache.time, "monotonic", clock)
+    monkeypatch.setattr(query_cache.time, "time", clock)
+    return clock
+
+
+@pytest.fixture(name="cache", params=["memory", "sqlite"])
+def fixture_cache(request: pytest.FixtureRequest, tmp_path: Any) -> Any:
+    """
+    Returns each real backend with a 10 second time to live and room for two entries.
+    """
+    if request.param == "memory":
+        return MemoryQueryCache(ttl=10.0, max_entries=2)
+    return SQLiteQueryCache(str(tmp_path / "cache.sqlite3"), ttl=10.0, max_entries=2)
+
+
+def test_cache_returns_rows_until_they_expire(cache: Any, clock: Clock) -> None:
+    """
+    Test that cached rows come back unchanged until their time to live has passed.
+
+    Asserts:
+        - Decimal, date and datetime values keep their type and value.
+        - The entry is gone once the time to live has passed.
+    """
+    assert cache.get("q") is None
+    cache.set("q", ROWS)
+    clock.now += 9.9
+    assert cache.get("q") == ROWS
+    assert [type(value) for value in cache.get("q")[0]] == [type(value) for value in ROWS[0]]
+
+    clock.now += 0.2
+    assert cache.get("q") is None
+
+
+def test_cache_evicts_least_recently_used(cache: Any, clock: Clock) -> None:
+    """
+    Test that a full cache evicts the entry that was used least recently.
+
+    Asserts:
+        - Reading an entry keeps it; the other one is evicted by a third entry.
+        - clear() removes every entry.
+    """
+    cache.set("a", [(1, )])
+    clock.now += 1
+    cache.set("b", [(2, )])
+    clock.now += 1
+    assert cache.get("a") == [(1, )]
+    clock.now += 1
+    cache.set("c", [(3, )])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [(1, )]
+    assert cache.get("c") == [(3, )]
+
+    cache.clear()
+    assert cache.get("a") is None and cache.get("c") is None
+
+
+def test_null_cache_keeps_nothing() -> None:
+    """
+    Test that the "none" backend never returns rows.
+
+    Asserts:
+        - Rows that were set are not returned.
+    """
+    cache = create_query_cache("none")
+    assert isinstance(cache, NullQueryCache)
+    cache.set("q", ROWS)
+    assert cache.get("q") is None
+    cache.clear()
+
+
+def test_query_cache_interface_is_abstract() -> None:
+    """
+    Test that the QueryCache interface cannot be used as a cache itself.
+
+    Asserts:
+        - Instantiating QueryCache raises TypeError.
+    """
+    with pytest.raises(TypeError):
+        QueryCache()  # pylint: disable=abstract-class-instantiated
+
+
+def test_create_query_cache_rejects_unknown_backend() -> None:
+    """
+    Test that an unknown backend name is rejected.
+
+    Asserts:
+        - ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        create_query_cache("redis")
+
+
+def test_sqlite_cache_is_shared_and_stores_json(tmp_path: Any) -> None:
+    """
+    Test that SQLite caches on the same file share entries, stored as JSON in an owner-only file.
+
+    Asserts:
+        - An entry set through one cache is read through another one on the same file.
+        - The stored rows are JSON text, not a pickle.
+        - On POSIX systems the file and its folder are only accessible by their owner.
+    """
+    path = tmp_path / "instance" / "cache.sqlite3"
+    first = SQLiteQueryCache(str(path))
+    first.set("q", ROWS)
+    assert SQLiteQueryCache(str(path)).get("q") == ROWS
+
+    with first._connect() as connection:
+        (text, ) = connection.execute("SELECT rows FROM query_cache").fetchone()
+    assert loads_rows(text) == ROWS and text == dumps_rows(ROWS)
+
+    if sys.platform != "win32":
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+
+
+def test_sqlite_cache_drops_unreadable_entries(tmp_path: Any) -> None:
+    """
+    Test that an entry that is not JSON rows, e.g. a planted pickle, is never decoded.
+
+    Asserts:
+        - The entry reads as a miss and is deleted.
+        - Rows with values JSON cannot hold are not cached.
+    """
+    cache = SQLiteQueryCache(str(tmp_path / "cache.sqlite3"))
+    with cache._connect() as connection:
+        connection.execute(
+            "INSERT INTO query_cache VALUES ('q', ?, 1e12, 0)", (b"\x80\x04\x95pickle", )
+        )
+    assert cache.get("q") is None
+    with cache._connect() as connection:
+        assert connection.execute("SELECT COUNT(*) FROM query_cache").fetchone() == (0, )
+
+    cache.set("q", [(object(), )])
+    assert cache.get("q") is None
+
+
+def test_default_sqlite_path_is_the_flask_instance_folder() -> None:
+    """
+    Test that the default SQLite file lives in the app's Flask instance folder.
+
+    Asserts:
+        - DEFAULT_CACHE_DIR is the instance path Flask gives the src.website app.
+    """
+    assert query_cache.DEFAULT_CACHE_DIR == Flask("src.website").instance_path
+
+
+def test_invalidate_query_cache_clears_the_shared_cache(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that invalidate_query_cache empties the process-wide cache created from the environment.
+
+    Asserts:
+        - get_query_cache builds the backend named by QUERY_CACHE_BACKEND, once.
+        - Entries are gone after invalidate_query_cache.
+    """
+    monkeypatch.setenv("QUERY_CACHE_BACKEND", "memory")
+    monkeypatch.setattr(query_cache, "_holder", query_cache._CacheHolder())
+    cache = query_cache.get_query_cache()
+    assert isinstance(cache, MemoryQueryCache) and query_cache.get_query_cache() is cache
+
+    cache.set("q", ROWS)
+    invalidate_query_cache()
+    assert cache.get("q") is None
@@ -0,0 +1,244 @@
+"""
+Module: test_query_data.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Tests for query_data. The tests with a stub connection need no database; the others
+connect with TEST_DATABASE_URL if it is set, else with the DB_* settings from .env, and are skipped
+when neither works.
+"""
+
+import os
+from typing import Any, Iterator
+
+import psycopg
+import pytest
+from psycopg import Connection
+from psycopg.sql import SQL
+
+from src.utils.database import database_conninfo
+from src.website import query_data
+from src.website.dashboard import (
+    DASHBOARD_QUERY, DASHBOARD_QUERY_NAME, DASHBOARD_SUMMARY_QUERY, DASHBOARD_SUMMARY_QUERY_NAME
+)
+from src.website.query_data import execute_named_query, iter_query, register_query
+
+
+class StubServerCursor:
+    """Named cursor handing out a fixed result a batch at a time."""
+
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+        self.batch_sizes: list[int] = []
+        self.closed = False
+
+    def __enter__(self) -> "StubServerCursor":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.closed = True
+
+    def execute(self, *_args: Any) -> None:
+        """Accept the query."""
+
+    def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        """Return the next ``size`` rows."""
+        self.batch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class StubConnection:
+    """Connection recording the server-side cursors it opens."""
+
+    closed = False
+
+    def __init__(self, autocommit: bool) -> None:
+        self.autocommit = autocommit
+        self.cursors: list[tuple[str, bool, StubServerCursor]] = []
+
+    def cursor(self, name: str, withhold: bool) -> StubServerCursor:
+        """Open a named cursor over five rows."""
+        cursor = StubServerCursor([(n, ) for n in range(5)])
+        self.cursors.append((name, withhold, cursor))
+        return cursor
+
+    def rollback(self) -> None:
+        """Do nothing."""
+
+
+@pytest.mark.parametrize("autocommit", [False, True])
+def test_iter_query_fetches_in_batches(autocommit: bool) -> None:
+    """
+    Test that rows are fetched batch_size at a time from a named cursor.
+
+    Asserts:
+        - Every row is yielded, in order.
+        - Rows are fetched with fetchmany(batch_size) until an empty batch.
+        - The cursor is declared WITH HOLD exactly when the connection is in autocommit mode.
+        - The cursor is closed once the rows run out.
+    """
+    connection = StubConnection(autocommit)
+
+    rows = list(iter_query(connection, "SELECT n", batch_size=2))  # type: ignore
+
+    assert rows == [(n, ) for n in range(5)]
+    assert len(connection.cursors) == 1
+    name, withhold, cursor = connection.cursors[0]
+    assert name.startswith("iter_query_")
+    assert withhold is autocommit
+    assert cursor.batch_sizes == [2, 2, 2, 2]
+    assert cursor.closed
+
+
+def test_iter_query_closes_abandoned_cursor() -> None:
+    """
+    Test that stopping the iteration early closes the server-side cursor.
+
+    Asserts:
+        - Only the first batch is fetched.
+        - Closing the generator closes the cursor.
+    """
+    connection = StubConnection(autocommit=True)
+    rows = iter_query(connection, "SELECT n", batch_size=2)  # type: ignore
+
+    assert next(rows) == (0, )
+    cursor = connection.cursors[0][2]
+    assert not cursor.closed
+
+    rows.close()
+    assert cursor.closed
+    assert cursor.batch_sizes == [2]
+
+
+def test_iter_query_rejects_bad_batch_size() -> None:
+    """
+    Test that a batch size below 1 is rejected.
+
+    Asserts:
+        - ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        next(iter_query(StubConnection(autocommit=False), "SELECT 1", batch_size=0))  # type: ignore
+
+
+@pytest.fixture(name="registry")
+def fixture_registry(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """
+    Gives each test an empty registry of named queries.
+    """
+    registry: dict[str, Any] = {}
+    monkeypatch.setattr(query_data, "NAMED_QUERIES", registry)
+    return registry
+
+
+def test_dashboard_queries_are_registered() -> None:
+    """
+    Test that importing the dashboard registers its queries.
+
+    Asserts:
+        - Both dashboard queries are registered under their names.
+    """
+    assert query_data.NAMED_QUERIES[DASHBOARD_QUERY_NAME] == DASHBOARD_QUERY
+    assert query_data.NAMED_QUERIES[DASHBOARD_SUMMARY_QUERY_NAME] == DASHBOARD_SUMMARY_QUERY
+
+
+def test_register_query_rejects_a_different_query_under_a_taken_name(
+    registry: dict[str, Any]
+) -> None:
+    """
+    Test that a name can be registered again with the same query but not with another one.
+
+    Asserts:
+        - Raw strings are registered as SQL.
+        - Registering the same query again (e.g. on a module reload) is accepted.
+        - Registering a different query under the name raises ValueError and keeps the first.
+    """
+    register_query("count", "SELECT COUNT(*) FROM applicants")
+    register_query("count", SQL("SELECT COUNT(*) FROM applicants"))
+    assert registry == {"count": SQL("SELECT COUNT(*) FROM applicants")}
+
+    with pytest.raises(ValueError):
+        register_query("count", "SELECT 1")
+    assert registry["count"] == SQL("SELECT COUNT(*) FROM applicants")
+
+
+def test_execute_named_query_rejects_unknown_name(registry: dict[str, Any]) -> None:
+    """
+    Test that running a name that was never registered fails before using any connection.
+
+    Asserts:
+        - ValueError is raised, even without a connection or pool.
+    """
+    assert not registry
+    with pytest.raises(ValueError, match="No query is registered as 'missing'"):
+        execute_named_query("missing", connection=None)
+
+
+@pytest.fixture(name="connection")
+def fixture_connection() -> Iterator[Connection]:
+    """
+    Yields a database connection, closed afterwards.
+    """
+    try:
+        connection = psycopg.connect(os.getenv("TEST_DATABASE_URL") or database_conninfo())
+    except Exception as err:  # pylint: disable=broad-except
+        pytest.skip(f"PostgreSQL is not available: {err}")
+    with connection:
+        yield connection
+
+
+def _open_cursors(connection: Connection) -> list[tuple[str, bool]]:
+    return [
+        (row[0], row[1]) for row in connection.execute(
+            "SELECT name, is_holdable FROM pg_cursors WHERE name LIKE 'iter_query_%'"
+        )
+    ]
+
+
+@pytest.mark.parametrize("autocommit", [False, True])
+def test_iter_query_streams_from_server_cursor(connection: Connection, autocommit: bool) -> None:
+    """
+    Test that iter_query streams a result through a server-side cursor.
+
+    Asserts:
+        - Every row is yielded, in order, across several batches.
+        - While iterating, the server holds the cursor, holdable only in autocommit mode.
+        - The cursor is gone once the iteration ends, and when it is abandoned early.
+    """
+    connection.autocommit = autocommit
+    query = "SELECT n FROM generate_series(1, %s) AS n"
+
+    rows = iter_query(connection, query, (25, ), batch_size=10)
+    assert next(rows) == (1, )
+    ((_, holdable), ) = _open_cursors(connection)
+    assert holdable is autocommit
+    assert [row[0] for row in rows] == list(range(2, 26))
+    assert not _open_cursors(connection)
+
+    abandoned = iter_query(connection, query, (25, ), batch_size=10)
+    assert next(abandoned) == (1, )
+    abandoned.close()
+    assert not _open_cursors(connection)
+
+
+def test_execute_named_query_prepares_once_per_connection(
+    connection: Connection, registry: dict[str, Any]
+) -> None:
+    """
+    Test that a named query is run as a server-side prepared statement, reused across calls.
+
+    Asserts:
+        - Each call returns the rows for its own parameters.
+        - The connection holds a single prepared statement after several calls.
+    """
+    register_query("double", "SELECT %(value)s::INT * 2")
+    assert list(registry) == ["double"]
+
+    results = [execute_named_query("double", {"value": n}, connection) for n in range(3)]
+
+    assert results == [[(0, )], [(2, )], [(4, )]]
+    prepared = connection.execute(
+        "SELECT statement FROM pg_prepared_statements WHERE statement LIKE '%%* 2%%'"
+    ).fetchall()
+    assert len(prepared) == 1
@@ -0,0 +1,119 @@
+"""
+Module: test_query_plans.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Checks with EXPLAIN, under the planner's default settings, how the queries the app
+runs on every page view and every load are planned: the homepage reads the applicant_summary view
+rather than the applicants table, and loads upsert against the unique URL index.
+
+The tests need a PostgreSQL server: they connect with TEST_DATABASE_URL if it is set, else with
+the DB_* settings from .env, and are skipped when neither works. They run in a throwaway schema
+that is dropped afterwards.
+"""
+
+import os
+import random
+from typing import Any, Iterator
+
+import psycopg
+import pytest
+from psycopg import Connection
+from psycopg.sql import SQL, Identifier
+
+from src.utils.database import database_conninfo
+from src.website.dashboard import (
+    DASHBOARD_PARAMS, DASHBOARD_SUMMARY_QUERY, create_applicant_summary
+)
+from src.website.load_data import (
+    APPLICANT_COLUMNS, INSERT_APPLICANT_QUERY, create_applicants_table
+)
+
+SCHEMA = "query_plans_test"
+ROWS = 5_000
+
+
+@pytest.fixture(scope="module", name="connection")
+def fixture_connection() -> Iterator[Connection]:
+    """
+    Yields a connection to a schema holding an analyzed applicants table and its summary view.
+    """
+    try:
+        connection = psycopg.connect(os.getenv("TEST_DATABASE_URL") or database_conninfo())
+    except Exception as err:  # pylint: disable=broad-except
+        pytest.skip(f"PostgreSQL is not available: {err}")
+
+    rng = random.Random(0)
+    with connection:
+        connection.execute(SQL("DROP SCHEMA IF EXISTS {0} CASCADE").format(Identifier(SCHEMA)))
+        connection.execute(SQL("CREATE SCHEMA {0}").format(Identifier(SCHEMA)))
+        connection.execute(SQL("SET search_path TO {0}").format(Identifier(SCHEMA)))
+        create_applicants_table(connection)
+        with connection.cursor().copy(
+            "COPY applicants (university, program, term, status, us_or_international, gpa, "
+            "degree, url) FROM STDIN"
+        ) as copy:
+            for i in range(ROWS):
+                copy.write_row((
+                    rng.choice(["Johns Hopkins University (JHU)", "MIT", "Stanford University"]),
+                    rng.choice(["Computer Science", "Physics", "Chemistry"]),
+                    rng.choice(["Fall 2025", "Spring 2025", "Fall 2024", "Fall 2023"]),
+                    rng.choice(["Accepted", "Rejected", "Wait listed", "Interview"]),
+                    rng.choice(["American", "International", "Other"]),
+                    round(rng.uniform(2.0, 4.0), 2),
+                    rng.choice(["Masters", "PhD"]),
+                    f"https://www.thegradcafe.com/result/{i}",
+                ))
+        connection.commit()
+        create_applicant_summary(connection)
+        connection.execute("ANALYZE applicants")
+        connection.execute("ANALYZE applicant_summary")
+        connection.commit()
+        try:
+            yield connection
+        finally:
+            connection.rollback()
+            connection.execute(SQL("DROP SCHEMA IF EXISTS {0} CASCADE").format(Identifier(SCHEMA)))
+            connection.commit()
+
+
+def _plan(connection: Connection, query: Any, params: Any) -> str:
+    rows = connection.execute(SQL("EXPLAIN {0}").format(query), params).fetchall()
+    connection.rollback()
+    return "\n".join(row[0] for row in rows)
+
+
+def test_dashboard_query_reads_summary_view(connection: Connection) -> None:
+    """
+    Test that the homepage query is answered from the summary view alone.
+
+    Asserts:
+        - The plan scans applicant_summary.
+        - The plan never touches the applicants table.
+    """
+    plan = _plan(connection, DASHBOARD_SUMMARY_QUERY, DASHBOARD_PARAMS)
+
+    assert "applicant_summary" in plan, plan
+    assert " applicants" not in plan, plan
+
+
+def test_upsert_uses_url_index(connection: Connection) -> None:
+    """
+    Test that loading an applicant checks for an existing entry through the unique URL index,
+    and that it maintains no other index.
+
+    Asserts:
+        - The conflict arbiter of the upsert is applicants_url_key.
+        - The table has no index besides its primary key and applicants_url_key.
+    """
+    plan = _plan(connection, INSERT_APPLICANT_QUERY, (None, ) * len(APPLICANT_COLUMNS))
+
+    assert "Conflict Arbiter Indexes: applicants_url_key" in plan, plan
+    indexes = {
+        row[0] for row in connection.execute(
+            "SELECT indexname FROM pg_indexes WHERE schemaname = %s AND tablename = 'applicants'",
+            (SCHEMA, )
+        )
+    }
+    connection.rollback()
+    assert indexes == {"applicants_pkey", "applicants_url_key"}
@@ -0,0 +1,77 @@
+"""
+Module: test_routes.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Unit tests for the homepage metrics of routes. The named queries are stubbed, so no
+database is needed.
+"""
+
+import logging
+from typing import Any, Mapping
+
+import pytest
+
+from src.website import routes
+from src.website.dashboard import (
+    DASHBOARD_METRICS, DASHBOARD_QUERY_NAME, DASHBOARD_SUMMARY_QUERY_NAME,
+    SUMMARY_EXISTS_QUERY_NAME
+)
+
+TABLE_ROW = tuple(range(len(DASHBOARD_METRICS)))
+SUMMARY_ROW = tuple(value + 100 for value in TABLE_ROW)
+
+
+def stub_queries(monkeypatch: pytest.MonkeyPatch, view_exists: bool) -> list[str]:
+    """Replace safe_fetch_named_query with canned results; returns the names of queries run."""
+    results = {
+        SUMMARY_EXISTS_QUERY_NAME: [(view_exists, )],
+        DASHBOARD_SUMMARY_QUERY_NAME: [SUMMARY_ROW],
+        DASHBOARD_QUERY_NAME: [TABLE_ROW],
+    }
+    ran: list[str] = []
+
+    def fetch(name: str, _params: Mapping[str, Any] | None = None) -> list[tuple[Any, ...]]:
+        ran.append(name)
+        return results[name]
+
+    monkeypatch.setattr(routes, "safe_fetch_named_query", fetch)
+    # pylint: disable-next=protected-access
+    monkeypatch.setattr(routes._dashboard_state, "fallback_logged", False)
+    return ran
+
+
+def test_dashboard_metrics_reads_summary_view(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the metrics come from the summary view when it exists.
+
+    Asserts:
+        - The summary query runs and the table is not aggregated.
+    """
+    ran = stub_queries(monkeypatch, view_exists=True)
+
+    assert routes.dashboard_metrics() == dict(zip(DASHBOARD_METRICS, SUMMARY_ROW))
+    assert ran == [SUMMARY_EXISTS_QUERY_NAME, DASHBOARD_SUMMARY_QUERY_NAME]
+
+
+def test_dashboard_metrics_skips_missing_view(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Test that, without the summary view, the metrics are aggregated from the table without
+    running the summary query, and that the fallback is logged once.
+
+    Asserts:
+        - The summary query never runs.
+        - Every page view gets the table metrics.
+        - One warning is logged for two page views, and no errors.
+    """
+    ran = stub_queries(monkeypatch, view_exists=False)
+
+    with caplog.at_level(logging.INFO, logger=routes.__name__):
+        first = routes.dashboard_metrics()
+        second = routes.dashboard_metrics()
+
+    assert first == second == dict(zip(DASHBOARD_METRICS, TABLE_ROW))
+    assert DASHBOARD_SUMMARY_QUERY_NAME not in ran
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
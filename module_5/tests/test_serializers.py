@@ -0,0 +1,90 @@
+"""
+Module: test_serializers.py
+Author: Billy Presume
+Created: 2026-10-18
+Modified: 2026-10-18
+Description: Unit tests for the JSON serializer backends and the applicant file reader built on
+them. No database is needed.
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+from src.utils.serializers import available_serializers, get_serializer
+from src.website.load_data import applicant_values, iter_json_data
+
+NUMERIC_RECORD = {
+    "url": "https://www.thegradcafe.com/result/1",
+    "gpa": 3.8,
+    "gre_score": 320,
+    "gre_v_score": "160",
+    "gre_aw_score": 4.5,
+}
+
+
+@pytest.mark.parametrize("serializer", available_serializers())
+@pytest.mark.parametrize("name", ["applicants.json", "applicants.jsonl"])
+def test_numeric_scores_load_with_every_serializer(
+    tmp_path: Any, serializer: str, name: str
+) -> None:
+    """
+    Test that scores and GPAs written as JSON numbers load like their text form.
+
+    Asserts:
+        - Every backend reads the record from a JSON array and from JSON Lines.
+        - The numbers become the same column values as the text the scraper writes.
+    """
+    path = tmp_path / name
+    if name.endswith(".jsonl"):
+        path.write_text(json.dumps(NUMERIC_RECORD) + "\n", encoding="utf-8")
+    else:
+        path.write_text(json.dumps([NUMERIC_RECORD]), encoding="utf-8")
+
+    records = list(iter_json_data(str(path), serializer=serializer))
+
+    assert len(records) == 1
+    values = applicant_values(records[0])
+    assert values["gpa"] == 3.8
+    assert values["gre"] == 320.0
+    assert values["gre_v"] == 160.0
+    assert values["gre_aw"] == 4.5
+    assert values["url"] == NUMERIC_RECORD["url"]
+
+
+@pytest.mark.parametrize("serializer", available_serializers())
+def test_serializers_share_api_and_errors(serializer: str) -> None:
+    """
+    Test that every backend offers the same functions and raises the same error types.
+
+    Asserts:
+        - dumps_pretty lays JSON out like json.dumps(obj, indent=2), and loads reads it back.
+        - Malformed JSON raises json.JSONDecodeError and unencodable objects TypeError.
+        - A records document that is not a list of objects raises ValueError.
+    """
+    backend = get_serializer(serializer)
+
+    assert backend.dumps_pretty({"a": [1]}) == json.dumps({"a": [1]}, indent=2).encode("utf-8")
+    assert backend.loads(backend.dumps({"a": [1]})) == {"a": [1]}
+    with pytest.raises(json.JSONDecodeError):
+        backend.load_records(b"not json")
+    with pytest.raises(TypeError):
+        backend.dumps({"a": object()})
+    with pytest.raises(ValueError):
+        backend.load_records(b'{"url": "a"}')
+    with pytest.raises(ValueError):
+        backend.load_record(b"[1, 2]")
+
+
+def test_msgspec_rejects_wrongly_typed_field() -> None:
+    """
+    Test that the typed msgspec decoder still rejects fields that are neither text nor numbers.
+
+    Asserts:
+        - A GPA given as a list raises ValueError.
+    """
+    if "msgspec" not in available_serializers():
+        pytest.skip("msgspec is not installed")
+    with pytest.raises(ValueError):
+        get_serializer("msgspec").load_record(b'{"gpa": [3.8]}')